@@ -0,0 +1,666 @@
+"""
+Benchmarks for the SOJAI press release PDF generator.
+
+    python bench_press_release_pdf.py styles --renders 2000
+    python bench_press_release_pdf.py backgrounds --pages 500
+    python bench_press_release_pdf.py chart --rows 10 100 1000
+    python bench_press_release_pdf.py suite --output bench.json --baseline baseline.json
+    python bench_press_release_pdf.py variants --count 20
+    python bench_press_release_pdf.py server --requests 50
+    python bench_press_release_pdf.py stream --pages 10 1000 10000
+    python bench_press_release_pdf.py parallel --sections 5 50 --workers 4
+    python bench_press_release_pdf.py text-metrics --renders 50
+    python bench_press_release_pdf.py page-total --pages 500
+    python bench_press_release_pdf.py images --reports 10 --pages 20
+    python bench_press_release_pdf.py output-profiles --repeat 10
+    python bench_press_release_pdf.py async --burst 16 --bursts 5 --max-queue 4
+"""
+
+import argparse
+import asyncio
+import http.client
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import reportlab
+from reportlab.lib.units import mm
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Image, PageBreak, Paragraph, Spacer
+
+import generate_press_release_pdf as gen
+import press_release_server
+from press_release_batch import percentile
+from press_release_spec import normalize_spec
+
+
+def _allocated(fn):
+    """Bytes still allocated by one call of fn while its result is alive."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def _timed(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return time.perf_counter() - start
+
+
+def _cold_render():
+    gen.get_styles.cache_clear()
+    return gen.render_pdf_bytes()
+
+
+def bench_styles(renders, full_renders):
+    """Per-render style set-up: rebuilt every render vs the shared registry."""
+    gen.get_styles()  # warm the registry so the shared path measures a lookup
+    rows = [
+        ("style set-up, rebuilt", _timed(gen.make_styles, renders) / renders,
+         _allocated(gen.make_styles)),
+        ("style set-up, registry", _timed(gen.get_styles, renders) / renders,
+         _allocated(gen.get_styles)),
+    ]
+    if full_renders:
+        gen.render_pdf_bytes()
+        rows.append(("full render, cold styles", _timed(_cold_render, full_renders) / full_renders, None))
+        rows.append(("full render, registry", _timed(gen.render_pdf_bytes, full_renders) / full_renders, None))
+
+    print(f"{'case':<28}{'time/render':>14}{'alloc/render':>16}")
+    for name, seconds, alloc in rows:
+        alloc_s = f"{alloc / 1024:.1f} KiB" if alloc is not None else "-"
+        print(f"{name:<28}{seconds * 1e6:>11.1f} us{alloc_s:>16}")
+    saved = rows[0][1] - rows[1][1]
+    print(f"\nsaved per render: {saved * 1e6:.1f} us, "
+          f"{(rows[0][2] - rows[1][2]) / 1024:.1f} KiB; "
+          f"over {renders} renders: {saved * renders:.2f} s")
+
+
+def _render_flowables(elements, background_forms=True, initial_bg="dark", page_total=True):
+    buf = io.BytesIO()
+    doc = gen.PressReleaseDocTemplate(
+        buf, pagesize=gen.A4, background_forms=background_forms, initial_bg=initial_bg, page_total=page_total,
+        leftMargin=gen.MARGIN_LR, rightMargin=gen.MARGIN_LR,
+        topMargin=gen.MARGIN_TB, bottomMargin=gen.MARGIN_TB)
+    doc.build(elements, onFirstPage=gen.on_page, onLaterPages=gen.on_page)
+    return buf.getvalue()
+
+
+def _long_report(pages, background_forms, page_total=True):
+    """Render a synthetic report alternating dark and light pages."""
+    styles = gen.get_styles()
+    elements = []
+    for i in range(pages):
+        dark = i % 2 == 0
+        elements.append(Paragraph(f"Section {i + 1}", styles['PageTitleWhite' if dark else 'PageTitle']))
+        elements.append(gen.SetPageBackground("light" if dark else "dark"))
+        elements.append(PageBreak())
+    return _render_flowables(elements, background_forms, page_total=page_total)
+
+
+def _press_release(background_forms):
+    return gen.build_pdf(io.BytesIO(), verbose=False, background_forms=background_forms).getvalue()
+
+
+def bench_backgrounds(pages, repeat):
+    """Inline background drawing vs one form XObject per background variant."""
+    cases = [
+        ("press release", _press_release),
+        (f"synthetic {pages} pages", lambda forms: _long_report(pages, forms)),
+    ]
+    print(f"{'document':<24}{'backgrounds':<13}{'time':>11}{'size':>13}")
+    for name, render in cases:
+        results = {}
+        for forms in (False, True):
+            render(forms)
+            seconds = _timed(lambda: render(forms), repeat) / repeat
+            results[forms] = (seconds, len(render(forms)))
+            label = "form xobject" if forms else "inline"
+            print(f"{name:<24}{label:<13}{seconds * 1e3:>8.1f} ms{results[forms][1]:>11} B")
+        (t0, s0), (t1, s1) = results[False], results[True]
+        print(f"{'':<24}{'change':<13}{(t1 / t0 - 1) * 100:>+9.1f} %{(s1 / s0 - 1) * 100:>+11.1f} %")
+
+
+def bench_chart(row_counts, repeat):
+    """AccuracyChart vs one AccuracyBar + Spacer per row, as row count grows."""
+    print(f"{'rows':>7}{'AccuracyBar rows':>20}{'AccuracyChart':>17}{'chart us/row':>15}")
+    for n in row_counts:
+        rows = [(f"Finding {i + 1}", round(90 + (i % 100) / 10, 1)) for i in range(n)]
+
+        def bars():
+            elements = []
+            for label, value in rows:
+                elements.append(gen.AccuracyBar(label, value, width=gen.PW))
+                elements.append(Spacer(1, 1 * mm))
+            return _render_flowables(elements, initial_bg="light")
+
+        def chart():
+            return _render_flowables([gen.AccuracyChart(rows, width=gen.PW, header=("FINDING", "ACCURACY"))],
+                                     initial_bg="light")
+
+        t_bars = _timed(bars, repeat) / repeat
+        t_chart = _timed(chart, repeat) / repeat
+        print(f"{n:>7}{t_bars * 1e3:>17.1f} ms{t_chart * 1e3:>14.1f} ms{t_chart / n * 1e6:>15.1f}")
+
+
+# ── Stage suite ──
+
+# Scenario name -> synthetic_spec() arguments.
+SCENARIOS = {
+    "press_release": {},
+    "rows_10": {"pathologies": 10},
+    "rows_100": {"pathologies": 100},
+    "rows_1000": {"pathologies": 1000},
+    "quotes_100": {"quotes": 100},
+}
+
+# Metrics compared against a baseline; for all of them higher is worse.
+_SIZE_METRICS = ("peak_memory", "bytes")
+
+
+def synthetic_spec(pathologies=None, quotes=None):
+    """Default spec scaled up to the given number of pathology rows and quotes."""
+    spec = normalize_spec()
+    if pathologies is not None:
+        spec["pathologies"] = [[f"Finding {i + 1}", round(90 + (i % 100) / 10, 1)]
+                               for i in range(pathologies)]
+    if quotes is not None:
+        spec["quotes"] = [spec["quotes"][i % len(spec["quotes"])] for i in range(quotes)]
+    return spec
+
+
+class _TimedCanvas(Canvas):
+    """Canvas that records how long final serialization (save) takes."""
+    save_seconds = 0.0
+
+    def save(self):
+        start = time.perf_counter()
+        Canvas.save(self)
+        self.save_seconds = time.perf_counter() - start
+
+
+def run_stages(spec):
+    """Render spec once from cold styles; returns (stage seconds, pages, bytes)."""
+    stages = {}
+    start = time.perf_counter()
+    gen.get_styles.cache_clear()
+    theme = gen.theme_from_spec(spec)
+    styles = gen.get_styles(theme)
+    stages["get_styles"] = time.perf_counter() - start
+
+    elements = []
+    for builder in gen.SECTION_BUILDERS:
+        start = time.perf_counter()
+        elements.extend(builder(styles, spec))
+        stages[builder.__name__] = time.perf_counter() - start
+
+    buf = io.BytesIO()
+    doc = gen.make_doc_template(buf, spec, theme)
+    start = time.perf_counter()
+    doc.build(elements, onFirstPage=gen.on_page, onLaterPages=gen.on_page, canvasmaker=_TimedCanvas)
+    built = time.perf_counter() - start
+    stages["serialize"] = doc.canv.save_seconds
+    stages["layout_draw"] = built - stages["serialize"]
+    return stages, doc.page_counter, len(buf.getvalue())
+
+
+def _peak_memory(spec):
+    tracemalloc.start()
+    try:
+        run_stages(spec)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(scenarios, repeat):
+    """Median stage timings, throughput, size and peak memory per scenario."""
+    results = {
+        "meta": {"python": platform.python_version(), "reportlab": reportlab.Version,
+                 "machine": platform.machine(), "repeat": repeat},
+        "scenarios": {},
+    }
+    for name in scenarios:
+        spec = synthetic_spec(**SCENARIOS[name])
+        run_stages(spec)  # warm imports and font caches
+        runs = [run_stages(spec) for _ in range(repeat)]
+        stages = {stage: statistics.median(r[0][stage] for r in runs) for stage in runs[0][0]}
+        total = sum(stages.values())
+        pages, size = runs[0][1], runs[0][2]
+        results["scenarios"][name] = {
+            "stages": stages,
+            "total": total,
+            "pages": pages,
+            "bytes": size,
+            "pages_per_second": pages / total,
+            "docs_per_second": 1 / total,
+            "peak_memory": _peak_memory(spec),
+        }
+    return results
+
+
+def print_suite(results):
+    stage_names = list(next(iter(results["scenarios"].values()))["stages"])
+    print(f"{'stage (ms)':<20}" + "".join(f"{name:>15}" for name in results["scenarios"]))
+    for stage in stage_names + ["total"]:
+        cells = [r["stages"][stage] if stage != "total" else r["total"] for r in results["scenarios"].values()]
+        print(f"{stage:<20}" + "".join(f"{c * 1e3:>15.2f}" for c in cells))
+    for key, fmt in (("pages", "{:>15d}"), ("pages_per_second", "{:>15.1f}"), ("docs_per_second", "{:>15.2f}"),
+                     ("bytes", "{:>15d}"), ("peak_memory", "{:>15d}")):
+        print(f"{key:<20}" + "".join(fmt.format(r[key]) for r in results["scenarios"].values()))
+
+
+def compare_to_baseline(results, baseline, threshold, min_seconds):
+    """List metrics that grew by more than threshold (a fraction) over baseline.
+
+    Timings must also have grown by at least min_seconds, so that noise on
+    microsecond-scale stages is not reported.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        pairs = [(f"stages.{stage}", value, base["stages"].get(stage), True)
+                 for stage, value in current["stages"].items()]
+        pairs.append(("total", current["total"], base.get("total"), True))
+        pairs.extend((metric, current[metric], base.get(metric), False) for metric in _SIZE_METRICS)
+        for metric, value, old, is_time in pairs:
+            if not old:
+                continue
+            if value > old * (1 + threshold) and (not is_time or value - old >= min_seconds):
+                regressions.append(f"{name}.{metric}: {old:.6g} -> {value:.6g} ({(value / old - 1) * 100:+.1f} %)")
+    return regressions
+
+
+def bench_suite(scenarios, repeat, output=None, baseline=None, threshold=0.10, min_seconds=0.001):
+    results = run_suite(scenarios, repeat)
+    print_suite(results)
+    if output:
+        with open(output, "w") as fh:
+            json.dump(results, fh, indent=2)
+    if baseline:
+        with open(baseline) as fh:
+            regressions = compare_to_baseline(results, json.load(fh), threshold, min_seconds)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {threshold:.0%} threshold:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nno regressions over {threshold:.0%} threshold")
+    return 0
+
+
+def bench_variants(count, scenarios):
+    """Per-variant cost of palette variants: full builds vs one layout + repaints."""
+    print(f"{'document':<16}{'layout':>10}{'full/variant':>15}{'paint/variant':>16}{'saved':>9}")
+    for name in scenarios:
+        spec = synthetic_spec(**SCENARIOS[name])
+        variants = [{"theme": {"primary": f"#{(i * 0x3A3A3A) % 0xFFFFFF:06X}"}} for i in range(count)]
+        gen.render_pdf_bytes(spec=spec)
+
+        start = time.perf_counter()
+        for variant in variants:
+            gen.build_pdf(io.BytesIO(), verbose=False, spec={**spec, **variant})
+        full = (time.perf_counter() - start) / count
+
+        start = time.perf_counter()
+        layout = gen.layout_document(spec)
+        layout_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for variant in variants:
+            gen.paint_layout(layout, io.BytesIO(), spec=normalize_spec({**spec, **variant}))
+        paint = (time.perf_counter() - start) / count
+        print(f"{name:<16}{layout_s * 1e3:>7.1f} ms{full * 1e3:>12.1f} ms{paint * 1e3:>13.1f} ms"
+              f"{(1 - paint / full) * 100:>8.1f}%")
+
+
+def bench_server(requests, cold_runs, workers):
+    """Cold CLI process per document vs requests to a warm render server."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generate_press_release_pdf.py")
+    cold = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(cold_runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, script, "--output", os.path.join(tmp, f"{i}.pdf")],
+                           check=True, stdout=subprocess.DEVNULL)
+            cold.append(time.perf_counter() - start)
+
+    service = press_release_server.RenderService(workers=workers, max_queue=requests)
+    service.warm()
+    server = press_release_server.make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    body = json.dumps({}).encode()
+    warm = []
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        for _ in range(requests):
+            start = time.perf_counter()
+            conn.request("POST", "/render", body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            warm.append(time.perf_counter() - start)
+            if response.status != 200:
+                raise RuntimeError(f"render server returned {response.status}")
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    print(f"{'path':<24}{'runs':>6}{'p50':>11}{'p99':>11}")
+    for name, samples in (("cold CLI process", sorted(cold)), ("warm server request", sorted(warm))):
+        print(f"{name:<24}{len(samples):>6}{percentile(samples, 50) * 1e3:>8.1f} ms"
+              f"{percentile(samples, 99) * 1e3:>8.1f} ms")
+
+
+def _stream_case(pages, stream, path):
+    gen.build_pdf(io.BytesIO(), verbose=False)  # warm imports, styles and fonts
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    gen.build_pdf(path, verbose=False, stream=stream, sections=[gen.build_announcement] * pages)
+    seconds = time.perf_counter() - start
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before  # KiB on Linux
+    with open(path, "rb") as fh:
+        page_count = fh.read().count(b"/Type /Page\n")
+    return seconds, growth, os.path.getsize(path), page_count
+
+
+def bench_stream(page_counts):
+    """Peak RSS growth of list vs streaming builds, one announcement section per page.
+
+    Every case runs in a fresh process so peaks from earlier cases do not hide
+    later ones. Both modes write to a file.
+    """
+    print(f"{'pages':>7}{'mode':>8}{'time':>10}{'peak RSS growth':>18}{'size':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in page_counts:
+            for stream in (False, True):
+                with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    seconds, growth, size, count = pool.submit(
+                        _stream_case, pages, stream, os.path.join(tmp, "out.pdf")).result()
+                print(f"{count:>7}{'stream' if stream else 'list':>8}{seconds:>8.1f} s"
+                      f"{growth / 1024:>15.1f} MB{size / 1024:>8.0f} KB")
+
+
+def bench_parallel(section_counts, workers, repeat):
+    """Serial build_pdf vs build_pdf_parallel on reports of announcement sections."""
+    print(f"cpus={os.cpu_count()} workers={workers}")
+    print(f"{'sections':>9}{'serial':>11}{'parallel':>12}{'speedup':>9}")
+    for count in section_counts:
+        sections = [gen.build_announcement] * count
+        serial = min(_timed(lambda: gen.build_pdf(io.BytesIO(), verbose=False, sections=sections), 1)
+                     for _ in range(repeat))
+        parallel = min(_timed(lambda: gen.build_pdf_parallel(io.BytesIO(), verbose=False, sections=sections,
+                                                             workers=workers), 1)
+                       for _ in range(repeat))
+        print(f"{count:>9}{serial * 1e3:>8.0f} ms{parallel * 1e3:>9.0f} ms{serial / parallel:>8.2f}x")
+
+
+def bench_text_metrics(renders, scenarios):
+    """Full renders and dry runs with and without the text metrics cache."""
+    print(f"{'document':<16}{'mode':>10}{'uncached':>11}{'cached':>11}{'speedup':>9}")
+    for name in scenarios:
+        spec = synthetic_spec(**SCENARIOS[name])
+        for mode, fn in (("render", lambda: gen.build_pdf(io.BytesIO(), verbose=False, spec=spec)),
+                         ("dry run", lambda: gen.dry_run(spec))):
+            gen.disable_text_metrics_cache()
+            fn()
+            uncached = _timed(fn, renders) / renders
+            gen.enable_text_metrics_cache()
+            fn()  # the first cached render fills the caches, as in a worker's first job
+            cached = _timed(fn, renders) / renders
+            print(f"{name:<16}{mode:>10}{uncached * 1e3:>8.1f} ms{cached * 1e3:>8.1f} ms{uncached / cached:>8.2f}x")
+    for cache, stats in gen.text_metrics_stats().items():
+        print(f"  {cache:<8} hit rate {stats['hit_rate']:.1%}  size {stats['size']}  evictions {stats['evictions']}")
+    gen.disable_text_metrics_cache()
+
+
+def bench_page_total(pages, repeat):
+    """"Page X" footers vs single-pass "Page X of Y" vs counting pages with a second build."""
+    cases = [
+        ("press release", lambda total: gen.build_pdf(io.BytesIO(), verbose=False, page_total=total).getvalue()),
+        (f"synthetic {pages} pages", lambda total: _long_report(pages, True, page_total=total)),
+    ]
+    print(f"{'document':<24}{'Page X':>11}{'X of Y':>11}{'change':>9}{'two pass':>11}{'size':>9}")
+    for name, render in cases:
+        times = {False: float("inf"), True: float("inf")}
+        for _ in range(repeat):  # alternate so drift and GC hit both footers alike
+            for total in (False, True):
+                times[total] = min(times[total], _timed(lambda: render(total), 1))
+        # A second full build is what multiBuild-style page counting costs.
+        two_pass = times[False] + times[True]
+        growth = len(render(True)) - len(render(False))
+        print(f"{name:<24}{times[False] * 1e3:>8.1f} ms{times[True] * 1e3:>8.1f} ms"
+              f"{(times[True] / times[False] - 1) * 100:>+8.1f}%{two_pass * 1e3:>8.1f} ms{growth:>+8} B")
+
+
+def _image_sources(directory):
+    """Write a CBCT-like slice, a panoramic and a logo into directory; returns their paths."""
+    from PIL import Image as PILImage, ImageDraw
+
+    paths = [os.path.join(directory, name) for name in ("slice.jpg", "panoramic.jpg", "logo.png")]
+    PILImage.effect_noise((2400, 2400), 40).convert("L").save(paths[0], quality=92)
+    gradient = PILImage.linear_gradient("L").resize((3000, 1200))
+    PILImage.merge("RGB", (gradient, gradient.transpose(PILImage.Transpose.FLIP_LEFT_RIGHT), gradient)).save(
+        paths[1], quality=92)
+    logo = PILImage.new("RGBA", (1200, 400), (0, 0, 0, 0))
+    ImageDraw.Draw(logo).rounded_rectangle((0, 0, 1199, 399), 80, fill=(91, 76, 219, 255))
+    logo.save(paths[2])
+    return paths
+
+
+def bench_images(reports, pages):
+    """reportlab's Image flowable vs RasterImage with a cold and a warm image cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        slice_path, pano_path, logo_path = _image_sources(tmp)
+        sizes = {"slice": (80 * mm, 80 * mm), "panoramic": (gen.PW, gen.PW * 0.4), "logo": (40 * mm, 40 * mm / 3)}
+
+        def story(flowable):
+            elements = []
+            for _ in range(pages):
+                elements += [flowable(logo_path, *sizes["logo"]), flowable(slice_path, *sizes["slice"]),
+                             flowable(pano_path, *sizes["panoramic"]), PageBreak()]
+            return elements
+
+        cases = [
+            ("reportlab Image", lambda: None, lambda path, w, h: Image(path, w, h)),
+            ("RasterImage cold", gen.IMAGE_CACHE.clear, lambda path, w, h: gen.RasterImage(path, w, h)),
+            ("RasterImage warm", lambda: None, lambda path, w, h: gen.RasterImage(path, w, h)),
+        ]
+        print(f"{reports} reports x {pages} pages, 3 images per page")
+        print(f"{'images':<20}{'per report':>12}{'size':>12}")
+        for name, before, flowable in cases:
+            seconds = 0.0
+            for _ in range(reports):
+                before()
+                start = time.perf_counter()
+                pdf = _render_flowables(story(flowable), initial_bg="light")
+                seconds += time.perf_counter() - start
+            print(f"{name:<20}{seconds / reports * 1e3:>9.1f} ms{len(pdf) / 1024:>9.0f} KB")
+        print(f"cache: {gen.IMAGE_CACHE.stats()}")
+
+
+def bench_profiles(repeat, pathologies, quotes):
+    """Render time against output size for each output profile."""
+    documents = [("press release", normalize_spec()),
+                 (f"{pathologies} rows, {quotes} quotes", synthetic_spec(pathologies, quotes))]
+    profiles = [None, *gen.OUTPUT_PROFILES]
+    print(f"{'document':<26}{'profile':<18}{'time':>10}{'size':>11}{'vs default':>12}")
+    for name, spec in documents:
+        times = dict.fromkeys(profiles, float("inf"))
+        sizes = {}
+        for _ in range(repeat):  # alternate profiles so drift hits them alike
+            for profile in profiles:
+                buf = io.BytesIO()
+                start = time.perf_counter()
+                gen.build_pdf(buf, verbose=False, spec=spec, output_profile=profile)
+                times[profile] = min(times[profile], time.perf_counter() - start)
+                sizes[profile] = len(buf.getvalue())
+        for profile in profiles:
+            label = profile or "reportlab default"
+            print(f"{name:<26}{label:<18}{times[profile] * 1e3:>7.1f} ms{sizes[profile] / 1024:>8.1f} KB"
+                  f"{(sizes[profile] / sizes[None] - 1) * 100:>+11.1f}%")
+
+
+async def _async_burst(render, burst, bursts):
+    """Fire bursts of concurrent renders; returns accepted latencies, rejections and worst loop lag."""
+    latencies, rejected, lag = [], 0, 0.0
+    stop = asyncio.Event()
+
+    async def ticker():
+        nonlocal lag
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, time.perf_counter() - start - 0.005)
+
+    async def one():
+        nonlocal rejected
+        start = time.perf_counter()
+        try:
+            await render()
+        except press_release_server.QueueFull:
+            rejected += 1
+        else:
+            latencies.append(time.perf_counter() - start)
+
+    tick = asyncio.create_task(ticker())
+    for _ in range(bursts):
+        await asyncio.gather(*(one() for _ in range(burst)))
+    stop.set()
+    await tick
+    return sorted(latencies), rejected, lag
+
+
+def bench_async(burst, bursts, workers, max_queue):
+    """Bounded render_async vs unbounded executor renders under request bursts."""
+    spec = normalize_spec()
+
+    async def run():
+        service = press_release_server.RenderService(workers=workers, max_queue=max_queue)
+        service.warm()
+        try:
+            bounded = await _async_burst(lambda: service.render_async(spec), burst, bursts)
+        finally:
+            service.close()
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(burst) as pool:
+            gen.render_pdf_bytes(spec=spec)  # warm the in-process styles like the workers
+            unbounded = await _async_burst(lambda: loop.run_in_executor(pool, lambda: gen.render_pdf_bytes(spec=spec)),
+                                           burst, bursts)
+        return bounded, unbounded
+
+    bounded, unbounded = asyncio.run(run())
+    print(f"{burst} concurrent requests x {bursts} bursts, {workers} worker(s), max queue {max_queue}")
+    print(f"{'path':<26}{'accepted':>9}{'rejected':>9}{'p50':>11}{'p99':>11}{'loop lag':>12}")
+    for name, (latencies, rejected, lag) in (("render_async (bounded)", bounded),
+                                             ("executor (unbounded)", unbounded)):
+        print(f"{name:<26}{len(latencies):>9}{rejected:>9}{percentile(latencies, 50) * 1e3:>8.1f} ms"
+              f"{percentile(latencies, 99) * 1e3:>8.1f} ms{lag * 1e3:>9.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="bench", required=True)
+    p = sub.add_parser("styles", help="style registry vs per-render style construction")
+    p.add_argument("--renders", type=int, default=2000)
+    p.add_argument("--full-renders", type=int, default=20,
+                   help="end-to-end renders to time for each case (0 to skip)")
+    p = sub.add_parser("backgrounds", help="inline page backgrounds vs form XObjects")
+    p.add_argument("--pages", type=int, default=500)
+    p.add_argument("--repeat", type=int, default=5)
+    p = sub.add_parser("chart", help="AccuracyChart scaling with row count")
+    p.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000])
+    p.add_argument("--repeat", type=int, default=3)
+    p = sub.add_parser("suite", help="per-stage timings, throughput, size and memory with baseline check")
+    p.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--output", help="write results as JSON")
+    p.add_argument("--baseline", help="JSON results to compare against")
+    p.add_argument("--threshold", type=float, default=0.10,
+                   help="allowed relative growth per metric (default 0.10 = 10%%)")
+    p.add_argument("--min-seconds", type=float, default=0.001,
+                   help="ignore timing growth smaller than this")
+    p = sub.add_parser("variants", help="layout-once / paint-many palette variants vs full builds")
+    p.add_argument("--count", type=int, default=20)
+    p.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=["press_release", "rows_100"])
+    p = sub.add_parser("server", help="cold CLI start-up vs warm render server latency")
+    p.add_argument("--requests", type=int, default=50)
+    p.add_argument("--cold-runs", type=int, default=5)
+    p.add_argument("--workers", type=int, default=1)
+    p = sub.add_parser("stream", help="peak memory of list vs streaming builds as page count grows")
+    p.add_argument("--pages", type=int, nargs="+", default=[10, 1000, 10000])
+    p = sub.add_parser("parallel", help="serial vs per-section parallel builds of long reports")
+    p.add_argument("--sections", type=int, nargs="+", default=[5, 50, 200])
+    p.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    p.add_argument("--repeat", type=int, default=3)
+    p = sub.add_parser("text-metrics", help="text metrics cache: repeated renders with and without it")
+    p.add_argument("--renders", type=int, default=50)
+    p.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=["press_release", "rows_100"])
+    p = sub.add_parser("page-total", help='"Page X of Y" footers: single pass vs plain footers')
+    p.add_argument("--pages", type=int, default=500)
+    p.add_argument("--repeat", type=int, default=15)
+    p = sub.add_parser("images", help="image embedding: reportlab Image vs cached, downsampled RasterImage")
+    p.add_argument("--reports", type=int, default=10)
+    p.add_argument("--pages", type=int, default=20)
+    p = sub.add_parser("output-profiles", help="render time vs output size for each output profile")
+    p.add_argument("--repeat", type=int, default=10)
+    p.add_argument("--pathologies", type=int, default=1000, help="rows in the scaled-up document")
+    p.add_argument("--quotes", type=int, default=100, help="quotes in the scaled-up document")
+    p = sub.add_parser("async", help="render_async with back-pressure vs unbounded executor renders")
+    p.add_argument("--burst", type=int, default=16, help="concurrent requests per burst")
+    p.add_argument("--bursts", type=int, default=5)
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--max-queue", type=int, default=4)
+    args = parser.parse_args(argv)
+    if args.bench == "suite":
+        return bench_suite(args.scenarios, args.repeat, args.output, args.baseline,
+                           args.threshold, args.min_seconds)
+    if args.bench == "styles":
+        bench_styles(args.renders, args.full_renders)
+    elif args.bench == "backgrounds":
+        bench_backgrounds(args.pages, args.repeat)
+    elif args.bench == "chart":
+        bench_chart(args.rows, args.repeat)
+    elif args.bench == "variants":
+        bench_variants(args.count, args.scenarios)
+    elif args.bench == "server":
+        bench_server(args.requests, args.cold_runs, args.workers)
+    elif args.bench == "stream":
+        bench_stream(args.pages)
+    elif args.bench == "parallel":
+        bench_parallel(args.sections, args.workers, args.repeat)
+    elif args.bench == "text-metrics":
+        bench_text_metrics(args.renders, args.scenarios)
+    elif args.bench == "page-total":
+        bench_page_total(args.pages, args.repeat)
+    elif args.bench == "images":
+        bench_images(args.reports, args.pages)
+    elif args.bench == "output-profiles":
+        bench_profiles(args.repeat, args.pathologies, args.quotes)
+    elif args.bench == "async":
+        bench_async(args.burst, args.bursts, args.workers, args.max_queue)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
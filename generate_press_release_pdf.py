@@ -13,8 +13,31 @@ from reportlab.platypus import (
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from reportlab.pdfbase import pdfdoc
+from reportlab.lib.rl_accel import fp_str
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase.pdfmetrics import standardFonts, stringWidth
 from reportlab.platypus.flowables import Flowable
+import reportlab.platypus.paragraph as _rl_paragraph
+from reportlab.rl_config import _FUZZ
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from itertools import chain, repeat
+import hashlib
+import io
+import json
+import math
+import mmap
 import os
+import threading
+import time
+import zlib
+
+from press_release_spec import OUTPUT_PROFILE_NAMES, THEME_SLOTS, normalize_spec
 
 # ── Brand Colors ──
 PRIMARY = HexColor("#4A39C0")
@@ -27,14 +50,164 @@ CYAN = HexColor("#00C8C8")
 WHITE = HexColor("#FFFFFF")
 DARK_BG = HexColor("#1A1A2E")
 
+
+@dataclass(frozen=True)
+class Theme:
+    """Brand palette shared by the styles, page backgrounds and custom flowables."""
+    name: str = "sojai"
+    primary: Color = PRIMARY
+    pink: Color = PINK
+    light_bg: Color = LIGHT_BG
+    badge_bg: Color = BADGE_BG
+    text_dark: Color = TEXT_DARK
+    text_muted: Color = TEXT_MUTED
+    cyan: Color = CYAN
+    white: Color = WHITE
+    dark_bg: Color = DARK_BG
+    cover_subtitle: Color = HexColor("#D0CCFF")
+    text_on_dark: Color = HexColor("#E8E8F0")
+    label_on_dark: Color = HexColor("#B0ADCC")
+    footer_on_dark: Color = HexColor("#8885AA")
+    detail_on_dark: Color = HexColor("#A0A0B8")
+    rule: Color = HexColor("#E0E0E5")
+    glow: Color = Color(0.29, 0.22, 0.75, alpha=0.08)
+    glow_secondary: Color = Color(0, 0.78, 0.78, alpha=0.05)
+
+
+DEFAULT_THEME = Theme()
+assert THEME_SLOTS == tuple(f.name for f in fields(Theme) if f.name != "name")
+
+
+def theme_from_spec(spec):
+    """Theme for the palette overrides of a normalized spec ("#RRGGBB[AA]" values)."""
+    overrides = dict(spec["theme"])
+    if not overrides:
+        return DEFAULT_THEME
+    name = overrides.pop("name", DEFAULT_THEME.name)
+    try:
+        colors = {slot: HexColor(value, hasAlpha=len(value) == 9) for slot, value in overrides.items()}
+        return replace(DEFAULT_THEME, name=name, **colors)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"bad theme override: {exc}") from None
+
+
 PAGE_W, PAGE_H = A4
 MARGIN_LR = 25 * mm
 MARGIN_TB = 20 * mm
 PW = PAGE_W - 2 * MARGIN_LR  # usable width
 
 
-# ── Global state for page background ──
-_current_bg = "light"  # "dark" or "light"
+# ── Output profiles ──
+@dataclass(frozen=True)
+class OutputProfile:
+    """How a render trades CPU time for output bytes.
+
+    compression_level is the zlib level for page and form streams (0 writes
+    them uncompressed); profiles never add reportlab's ASCII85 layer, which
+    only inflates binary streams by a quarter. lean_drawing drops operators
+    that change nothing on the page (see drop_redundant_ops). The report
+    only uses the standard 14 fonts, which viewers supply, so there is no
+    font embedding or subsetting to tune.
+    """
+    name: str
+    compression_level: int = 6
+    lean_drawing: bool = True
+
+
+# Deflate output stops shrinking past level 6 on these content streams, so
+# there are two useful points: level 1 without the lean pass spends about
+# half the compression time for files roughly a fifth larger.
+OUTPUT_PROFILES = {
+    "fast": OutputProfile("fast", compression_level=1, lean_drawing=False),
+    "smallest": OutputProfile("smallest", compression_level=9),
+}
+assert tuple(OUTPUT_PROFILES) == OUTPUT_PROFILE_NAMES
+
+
+def get_output_profile(profile):
+    """OutputProfile for a profile name, an OutputProfile or None (reportlab defaults)."""
+    if profile is None or isinstance(profile, OutputProfile):
+        return profile
+    try:
+        return OUTPUT_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"unknown output profile {profile!r}") from None
+
+
+class FlateFilter:
+    """reportlab stream filter for FlateDecode at a chosen zlib level."""
+    pdfname = "FlateDecode"
+
+    def __init__(self, level):
+        self.level = level
+
+    def encode(self, text):
+        if isinstance(text, str):
+            text = text.encode("utf8")
+        return zlib.compress(text, self.level)
+
+    def decode(self, encoded):
+        return zlib.decompress(encoded)
+
+
+def drop_redundant_ops(canvas_obj):
+    """Remove save/translate/restore groups that draw nothing from the current page.
+
+    Flowables that paint nothing (Spacer, SetPageBackground...) still leave
+    "q", "1 0 0 1 x y cm", "Q" behind; nested empty groups collapse too.
+    """
+    out = []
+    for op in canvas_obj._code:
+        if op == "Q" and out:
+            if out[-1] == "q":
+                del out[-1]
+                continue
+            if len(out) > 1 and out[-2] == "q" and out[-1].endswith(" cm"):
+                del out[-2:]
+                continue
+        out.append(op)
+    canvas_obj._code[:] = out
+
+
+# ── Per-document render context ──
+class PressReleaseDocTemplate(SimpleDocTemplate):
+    """Document template that owns the page state of a single render.
+
+    The background requested by SetPageBackground and the page counter used by
+    on_page live on the template instead of module globals, so any number of
+    documents can be built concurrently in one process. With background_forms
+    each background variant is emitted once as a form XObject and referenced
+    from every page that uses it. With page_total the footer reads
+    "Page X of Y" (see page_total_form). An output_profile (see
+    OutputProfile) sets stream compression and lean drawing on every canvas
+    the template makes.
+    """
+    def __init__(self, filename, initial_bg="dark", theme=DEFAULT_THEME,
+                 background_forms=True, footer="SOJAI  |  Press Release 2026", page_total=True,
+                 output_profile=None, **kw):
+        SimpleDocTemplate.__init__(self, filename, **kw)
+        self.output_profile = get_output_profile(output_profile)
+        self.lean_drawing = self.output_profile is not None and self.output_profile.lean_drawing
+        self.theme = theme
+        self.footer = footer
+        self.background_forms = background_forms
+        self.page_total = page_total
+        self.current_bg = initial_bg  # "dark" or "light"
+        self.page_counter = 0
+
+    def _makeCanvas(self, filename=None, canvasmaker=Canvas):
+        canv = SimpleDocTemplate._makeCanvas(self, filename, canvasmaker)
+        profile = self.output_profile
+        if profile is not None:
+            # Uncompressed page and form streams fall through to the document's filters.
+            canv.setPageCompression(0)
+            canv._doc.defaultStreamFilters = [FlateFilter(profile.compression_level)] \
+                if profile.compression_level else None
+        return canv
+
+    def afterPage(self):
+        if self.lean_drawing:
+            drop_redundant_ops(self.canv)
 
 
 class SetPageBackground(Flowable):
@@ -46,8 +219,7 @@ class SetPageBackground(Flowable):
         self.height = 0
 
     def draw(self):
-        global _current_bg
-        _current_bg = self.bg_type
+        self.canv._doctemplate.current_bg = self.bg_type
 
     def wrap(self, *args):
         return (0, 0)
@@ -72,8 +244,9 @@ class HLine(Flowable):
 
 class AccuracyBar(Flowable):
     """Custom accuracy bar visualization."""
-    def __init__(self, label, value, width=440, bar_height=12):
+    def __init__(self, label, value, width=440, bar_height=12, theme=DEFAULT_THEME):
         Flowable.__init__(self)
+        self.theme = theme
         self.label = label
         self.value = value
         self.bar_width = width
@@ -85,148 +258,848 @@ class AccuracyBar(Flowable):
 
     def draw(self):
         c = self.canv
+        t = self.theme
         c.setFont("Helvetica", 9.5)
-        c.setFillColor(TEXT_DARK)
+        c.setFillColor(t.text_dark)
         c.drawString(0, self.total_height - 11, self.label)
         c.setFont("Helvetica-Bold", 9.5)
-        c.setFillColor(PRIMARY)
+        c.setFillColor(t.primary)
         c.drawRightString(self.bar_width, self.total_height - 11, f"{self.value}%")
-        c.setFillColor(BADGE_BG)
+        c.setFillColor(t.badge_bg)
         c.roundRect(0, 0, self.bar_width, self.bar_height, 6, fill=1, stroke=0)
         fill_w = self.bar_width * (self.value / 100.0)
-        c.setFillColor(PRIMARY)
+        c.setFillColor(t.primary)
         c.roundRect(0, 0, fill_w, self.bar_height, 6, fill=1, stroke=0)
 
 
+def _as_list(seq):
+    """Plain list from a sequence or NumPy array (without importing NumPy)."""
+    return seq.tolist() if hasattr(seq, "tolist") else list(seq)
+
+
+class AccuracyChart(Flowable):
+    """Accuracy bars for any number of rows, drawn in batched layers.
+
+    rows is a sequence (or NumPy array) of (label, value) pairs; alternatively
+    pass the labels as rows and the values separately. Each layer -- labels,
+    values, tracks, fills -- is emitted with a single font and fill colour set-up,
+    so cost grows linearly with the row count. The chart splits between rows
+    across pages, repeating the optional (label, value) header on each part.
+    """
+    row_height = 26
+    header_height = 16
+
+    def __init__(self, rows, values=None, width=440, bar_height=12, row_gap=1 * mm,
+                 header=None, min_rows=2, theme=DEFAULT_THEME):
+        Flowable.__init__(self)
+        if values is None:
+            pairs = _as_list(rows)
+            labels = [p[0] for p in pairs]
+            values = [p[1] for p in pairs]
+        else:
+            labels = _as_list(rows)
+            values = _as_list(values)
+        if len(labels) != len(values):
+            raise ValueError(f"AccuracyChart got {len(labels)} labels but {len(values)} values")
+        self.labels = [str(label) for label in labels]
+        # Rows of a 2-column NumPy array share a string dtype, so values may arrive as text.
+        self.values = [v if isinstance(v, (int, float)) else float(v) for v in values]
+        self.bar_width = width
+        self.bar_height = bar_height
+        self.row_gap = row_gap
+        self.header = header
+        self.min_rows = min_rows
+        self.theme = theme
+
+    def _height(self, n):
+        head = self.header_height if self.header else 0
+        return head + n * self.row_height + max(n - 1, 0) * self.row_gap
+
+    def wrap(self, *args):
+        return (self.bar_width, self._height(len(self.labels)))
+
+    def _part(self, start, stop):
+        return AccuracyChart(self.labels[start:stop], self.values[start:stop], self.bar_width,
+                             self.bar_height, self.row_gap, self.header, self.min_rows, self.theme)
+
+    def split(self, availWidth, availHeight):
+        n = len(self.labels)
+        head = self.header_height if self.header else 0
+        fit = int((availHeight - head + self.row_gap) // (self.row_height + self.row_gap))
+        fit = min(fit, n - self.min_rows)
+        if fit < self.min_rows:
+            return []
+        return [self._part(0, fit), self._part(fit, n)]
+
+    def draw(self):
+        c = self.canv
+        t = self.theme
+        w = self.bar_width
+        top = self._height(len(self.labels))
+        pitch = self.row_height + self.row_gap
+
+        if self.header:
+            tx = c.beginText()
+            tx.setFont("Helvetica-Bold", 8)
+            tx.setFillColor(t.text_muted)
+            label, value = self.header
+            tx.setTextOrigin(0, top - 10)
+            tx.textOut(label)
+            tx.setTextOrigin(w - stringWidth(value, "Helvetica-Bold", 8), top - 10)
+            tx.textOut(value)
+            c.drawText(tx)
+            top -= self.header_height
+
+        bases = [top - self.row_height - i * pitch for i in range(len(self.labels))]
+        text_dy = self.row_height - 11
+
+        tx = c.beginText()
+        tx.setFont("Helvetica", 9.5)
+        tx.setFillColor(t.text_dark)
+        for y, label in zip(bases, self.labels):
+            tx.setTextOrigin(0, y + text_dy)
+            tx.textOut(label)
+        tx.setFont("Helvetica-Bold", 9.5)
+        tx.setFillColor(t.primary)
+        for y, value in zip(bases, self.values):
+            text = f"{value}%"
+            tx.setTextOrigin(w - stringWidth(text, "Helvetica-Bold", 9.5), y + text_dy)
+            tx.textOut(text)
+        c.drawText(tx)
+
+        tracks = c.beginPath()
+        fills = c.beginPath()
+        for y, value in zip(bases, self.values):
+            tracks.roundRect(0, y, w, self.bar_height, 6)
+            fills.roundRect(0, y, w * (value / 100.0), self.bar_height, 6)
+        c.setFillColor(t.badge_bg)
+        c.drawPath(tracks, fill=1, stroke=0)
+        c.setFillColor(t.primary)
+        c.drawPath(fills, fill=1, stroke=0)
+
+
+# ── Profiling ──
+class RenderProfiler:
+    """Opt-in timing of one build: flowable wrap/split/draw, page callbacks, pages.
+
+    Instrumentation is attached to the flowable instances of a single build
+    (and to the parts they split into), never to classes, so builds without a
+    profiler run untouched code and concurrent builds do not interfere.
+    Timings are inclusive: a Table's draw contains its cells' draws.
+    """
+    OPS = ("wrap", "split", "draw")
+
+    def __init__(self):
+        self.events = []  # (name, category, start_ns, duration_ns, page)
+        self.pages = []   # (page, start_ns)
+        self.page = 0
+        self._end_ns = None
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+
+    def instrument(self, flowables):
+        """Attach timing wrappers to flowables and everything nested in them."""
+        for f in flowables:
+            if isinstance(f, (list, tuple)):
+                self.instrument(f)
+            elif isinstance(f, Flowable) and not f.__dict__.get("_profiled"):
+                f._profiled = True
+                for op in self.OPS:
+                    method = getattr(f, op, None)
+                    if method is not None:
+                        setattr(f, op, self._timed(f, op, method))
+                self.instrument(getattr(f, "_content", ()))     # KeepTogether & co.
+                self.instrument(getattr(f, "_cellvalues", ()))  # Table cells
+        return flowables
+
+    def _timed(self, flowable, op, method):
+        name = f"{type(flowable).__name__}.{op}"
+
+        def timed(*args, **kw):
+            start = time.perf_counter_ns()
+            result = method(*args, **kw)
+            self.events.append((name, op, start, time.perf_counter_ns() - start, self.page))
+            if op == "split":
+                self.instrument(result)
+            return result
+        return timed
+
+    def page_callback(self, callback):
+        """Wrap an onPage callback to time it and mark page boundaries."""
+        def timed(canvas_obj, doc):
+            start = time.perf_counter_ns()
+            self.page += 1
+            self.pages.append((self.page, start))
+            callback(canvas_obj, doc)
+            self.events.append((callback.__name__, "page_callback", start,
+                                time.perf_counter_ns() - start, self.page))
+        return timed
+
+    def finish(self):
+        self._end_ns = time.perf_counter_ns()
+
+    def chrome_trace(self):
+        """Events in Chrome trace-event format (load in chrome://tracing or Perfetto)."""
+        origin = min([start for _, start in self.pages] + [e[2] for e in self.events], default=0)
+
+        def us(ns):
+            return (ns - origin) / 1000
+
+        events = []
+        ends = [start for _, start in self.pages[1:]] + [self._end_ns or time.perf_counter_ns()]
+        for (page, start), end in zip(self.pages, ends):
+            events.append({"name": f"page {page}", "cat": "page", "ph": "X", "ts": us(start),
+                           "dur": (end - start) / 1000, "pid": self._pid, "tid": 0})
+        for name, cat, start, dur, page in self.events:
+            events.append({"name": name, "cat": cat, "ph": "X", "ts": us(start), "dur": dur / 1000,
+                           "pid": self._pid, "tid": self._tid, "args": {"page": page}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w") as fh:
+            json.dump(self.chrome_trace(), fh)
+
+    def summary(self, top=20):
+        """Top call sites by inclusive time: (name, calls, total_ms, mean_us, max_us)."""
+        totals = {}
+        for name, _cat, _start, dur, _page in self.events:
+            calls, total, worst = totals.get(name, (0, 0, 0))
+            totals[name] = (calls + 1, total + dur, max(worst, dur))
+        rows = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        return [(name, calls, total / 1e6, total / calls / 1e3, worst / 1e3)
+                for name, (calls, total, worst) in rows]
+
+    def format_summary(self, top=20):
+        lines = [f"{'call':<28}{'calls':>8}{'total ms':>11}{'mean us':>10}{'max us':>10}"]
+        for name, calls, total_ms, mean_us, max_us in self.summary(top):
+            lines.append(f"{name:<28}{calls:>8}{total_ms:>11.2f}{mean_us:>10.1f}{max_us:>10.1f}")
+        return "\n".join(lines)
+
+
 # ── Page callback ──
-_page_counter = [0]
+def _is_pure_white(color):
+    return (color.red, color.green, color.blue, color.alpha) == (1, 1, 1, 1)
 
 
-def on_page(canvas_obj, doc):
-    global _current_bg
-    _page_counter[0] += 1
-    page = _page_counter[0]
-    w, h = A4
+def draw_background(canvas_obj, theme, variant, lean=False):
+    """Paint a full-page background: "dark", "light" or "light_header".
 
-    if _current_bg == "dark":
-        canvas_obj.setFillColor(DARK_BG)
+    With lean, light pages skip the page fill when theme.white is pure white,
+    which is what a PDF page already is.
+    """
+    w, h = A4
+    if variant == "dark":
+        canvas_obj.setFillColor(theme.dark_bg)
         canvas_obj.rect(0, 0, w, h, fill=1, stroke=0)
-        canvas_obj.setFillColor(Color(0.29, 0.22, 0.75, alpha=0.08))
+        canvas_obj.setFillColor(theme.glow)
         canvas_obj.circle(w - 40 * mm, h - 30 * mm, 80 * mm, fill=1, stroke=0)
-        canvas_obj.setFillColor(Color(0, 0.78, 0.78, alpha=0.05))
+        canvas_obj.setFillColor(theme.glow_secondary)
         canvas_obj.circle(30 * mm, 40 * mm, 60 * mm, fill=1, stroke=0)
     else:
-        canvas_obj.setFillColor(WHITE)
-        canvas_obj.rect(0, 0, w, h, fill=1, stroke=0)
-        if page > 1:
-            canvas_obj.setFillColor(PRIMARY)
+        if not (lean and _is_pure_white(theme.white)):
+            canvas_obj.setFillColor(theme.white)
+            canvas_obj.rect(0, 0, w, h, fill=1, stroke=0)
+        if variant == "light_header":
+            canvas_obj.setFillColor(theme.primary)
             canvas_obj.rect(0, h - 3, w, 3, fill=1, stroke=0)
 
+
+def define_background_form(canvas_obj, name, theme, variant, lean=False):
+    """Emit a background variant as a reusable form XObject on canvas_obj."""
+    canvas_obj.beginForm(name)
+    draw_background(canvas_obj, theme, variant, lean)
+    canvas_obj.endForm()
+    # reportlab leaves ExtGState out of form resources; the alpha glows need it.
+    form = canvas_obj._doc.idToObject[pdfdoc.xObjectName(name)]
+    if form.ExtGState:
+        resources = pdfdoc.PDFResourceDictionary()
+        resources.basicFonts()
+        resources.allProcs()
+        resources.ExtGState = form.ExtGState
+        form.Resources = resources
+
+
+FOOTER_FONT = "Helvetica"
+FOOTER_SIZE = 8
+FOOTER_Y = 12 * mm
+PAGE_TOTAL_FORM = "PRPageTotal"
+
+
+class PageTotalForm(pdfdoc.PDFFormXObject):
+    """Form XObject drawing a page count at (x, y); the count is fixed when it is serialized."""
+    def __init__(self, x, y):
+        pdfdoc.PDFFormXObject.__init__(self, 0, 0, *A4)
+        self.x = x
+        self.y = y
+        self.total = 0
+
+    def format(self, document):
+        font = document.getInternalFontName(FOOTER_FONT)
+        self.setStreamList(f"BT {font} {FOOTER_SIZE} Tf 1 0 0 1 {fp_str(self.x, self.y)} Tm ({self.total}) Tj ET")
+        return pdfdoc.PDFFormXObject.format(self, document)
+
+
+def page_total_form(canvas_obj, footer):
+    """The shared page-count form of canvas_obj, registered on first use.
+
+    Footers draw "Page X of " ending at form.x and then the form, so the
+    count is written once per document in a single layout pass. Registering
+    reserves the form's object number: pages can reference it before the
+    last page exists, including pages StreamingCanvas has already written.
+    Forms are only serialized at save(), so the file carries the last total
+    set. Helvetica digits share one width, so a footer centred as if the
+    total had as many digits as its page number always puts the count at
+    the same x. The text takes its colour from the page that draws it.
+    """
+    doc = canvas_obj._doc
+    name = pdfdoc.xObjectName(PAGE_TOTAL_FORM)
+    form = doc.idToObject.get(name)
+    if form is None:
+        label_w = canvas_obj.stringWidth(f"{footer}  |  Page  of ", FOOTER_FONT, FOOTER_SIZE)
+        form = PageTotalForm((A4[0] + label_w) / 2, FOOTER_Y)
+        form.compression = canvas_obj._pageCompression
+        doc.Reference(form, name)
+    return form
+
+
+def on_page(canvas_obj, doc):
+    doc.page_counter += 1
+    page = doc.page_counter
+    w, h = A4
+
+    variant = doc.current_bg
+    if variant == "light" and page > 1:
+        variant = "light_header"
+    if doc.lean_drawing and variant == "light" and _is_pure_white(doc.theme.white):
+        pass  # nothing to paint on a plain white page
+    elif doc.background_forms:
+        # Forms are per canvas, so each document defines a variant on first use.
+        name = f"PRBackground_{variant}"
+        if not canvas_obj.hasForm(name):
+            define_background_form(canvas_obj, name, doc.theme, variant, doc.lean_drawing)
+        canvas_obj.doForm(name)
+    else:
+        draw_background(canvas_obj, doc.theme, variant, doc.lean_drawing)
+
+    if doc.page_total:
+        total_form = page_total_form(canvas_obj, doc.footer)
+        total_form.total = page
     if page > 1:
-        canvas_obj.setFont("Helvetica", 8)
-        color = HexColor("#6B6B80") if _current_bg == "dark" else TEXT_MUTED
-        canvas_obj.setFillColor(color)
-        canvas_obj.drawCentredString(w / 2, 12 * mm, f"SOJAI  |  Press Release 2026  |  Page {page}")
+        canvas_obj.setFont(FOOTER_FONT, FOOTER_SIZE)
+        canvas_obj.setFillColor(doc.theme.text_muted)
+        if doc.page_total:
+            canvas_obj.drawRightString(total_form.x, FOOTER_Y, f"{doc.footer}  |  Page {page} of ")
+            canvas_obj.doForm(PAGE_TOTAL_FORM)
+        else:
+            canvas_obj.drawCentredString(w / 2, FOOTER_Y, f"{doc.footer}  |  Page {page}")
 
 
 # ── Styles ──
-def get_styles():
+# (name, font, size, leading, theme colour, alignment, space after)
+_STYLE_DEFS = [
+    ('CoverTitle', 'Helvetica-Bold', 36, 44, 'white', TA_CENTER, 8 * mm),
+    ('CoverSubtitle', 'Helvetica', 15, 22, 'cover_subtitle', TA_CENTER, 6 * mm),
+    ('CoverTag', 'Helvetica-Bold', 11, 16, 'cyan', TA_CENTER, 4 * mm),
+    ('PageTitle', 'Helvetica-Bold', 26, 32, 'primary', TA_LEFT, 5 * mm),
+    ('PageTitleWhite', 'Helvetica-Bold', 26, 32, 'white', TA_LEFT, 5 * mm),
+    ('SectionBadge', 'Helvetica-Bold', 10, 14, 'primary', TA_LEFT, 3 * mm),
+    ('SectionBadgeWhite', 'Helvetica-Bold', 10, 14, 'cyan', TA_LEFT, 3 * mm),
+    ('BodyText14', 'Helvetica', 11, 18, 'text_dark', TA_JUSTIFY, 3.5 * mm),
+    ('BodyTextWhite', 'Helvetica', 11, 18, 'text_on_dark', TA_JUSTIFY, 3.5 * mm),
+    ('QuoteName', 'Helvetica-Bold', 12, 16, 'primary', TA_LEFT, 1 * mm),
+    ('QuoteRole', 'Helvetica', 10, 14, 'text_muted', TA_LEFT, 3 * mm),
+    ('QuoteText', 'Helvetica-Oblique', 11, 18, 'text_dark', TA_JUSTIFY, 4 * mm),
+    ('StatNumber', 'Helvetica-Bold', 28, 34, 'primary', TA_CENTER, 0),
+    ('StatLabel', 'Helvetica', 9.5, 13, 'text_muted', TA_CENTER, 0),
+    ('FooterText', 'Helvetica', 8, 11, 'text_muted', TA_CENTER, 0),
+    ('BulletItem', 'Helvetica', 10.5, 16, 'text_dark', TA_LEFT, 2 * mm),
+    ('BulletItemWhite', 'Helvetica', 10.5, 16, 'text_on_dark', TA_LEFT, 2 * mm),
+    ('CTATitle', 'Helvetica-Bold', 22, 28, 'primary', TA_CENTER, 4 * mm),
+    ('CTABody', 'Helvetica', 12, 18, 'text_muted', TA_CENTER, 3 * mm),
+    ('FeatureTitle', 'Helvetica-Bold', 9.5, 13, 'primary', TA_CENTER, 0),
+    ('FeatureDesc', 'Helvetica', 8.5, 12, 'text_muted', TA_CENTER, 0),
+]
+
+# (name, parent, overrides) -- theme colour overrides are given by slot name
+_DERIVED_STYLE_DEFS = [
+    ('StatLabelDark', 'StatLabel', {'textColor': 'label_on_dark'}),
+    ('CoverFooter', 'FooterText', {'textColor': 'footer_on_dark'}),
+    ('PainTitle', 'BulletItemWhite', {'leftIndent': 0, 'bulletIndent': 0}),
+    ('PainDesc', 'BulletItemWhite', {'textColor': 'detail_on_dark', 'fontSize': 9.5, 'leftIndent': 0}),
+    ('StepTitle', 'BodyText14', {'fontSize': 12.5, 'fontName': 'Helvetica-Bold',
+                                 'textColor': 'primary', 'spaceAfter': 1.5 * mm}),
+    ('CTASmall', 'CTABody', {'fontSize': 10, 'textColor': 'text_muted'}),
+]
+
+
+class StyleRegistry(Mapping):
+    """Read-only set of paragraph styles built once per theme.
+
+    Instances are shared by every render using the same theme (and across
+    threads), so the styles they hand out must not be mutated.
+    """
+    def __init__(self, styles, theme):
+        self._styles = dict(styles)
+        self.theme = theme
+
+    def __getitem__(self, name):
+        return self._styles[name]
+
+    def __iter__(self):
+        return iter(self._styles)
+
+    def __len__(self):
+        return len(self._styles)
+
+
+def make_styles(theme=DEFAULT_THEME):
+    """Build a fresh StyleRegistry for theme; renders should use get_styles()."""
     styles = getSampleStyleSheet()
-    defs = [
-        ('CoverTitle', 'Helvetica-Bold', 36, 44, WHITE, TA_CENTER, 8 * mm),
-        ('CoverSubtitle', 'Helvetica', 15, 22, HexColor("#D0CCFF"), TA_CENTER, 6 * mm),
-        ('CoverTag', 'Helvetica-Bold', 11, 16, CYAN, TA_CENTER, 4 * mm),
-        ('PageTitle', 'Helvetica-Bold', 26, 32, PRIMARY, TA_LEFT, 5 * mm),
-        ('PageTitleWhite', 'Helvetica-Bold', 26, 32, WHITE, TA_LEFT, 5 * mm),
-        ('SectionBadge', 'Helvetica-Bold', 10, 14, PRIMARY, TA_LEFT, 3 * mm),
-        ('SectionBadgeWhite', 'Helvetica-Bold', 10, 14, CYAN, TA_LEFT, 3 * mm),
-        ('BodyText14', 'Helvetica', 11, 18, TEXT_DARK, TA_JUSTIFY, 3.5 * mm),
-        ('BodyTextWhite', 'Helvetica', 11, 18, HexColor("#E8E8F0"), TA_JUSTIFY, 3.5 * mm),
-        ('QuoteName', 'Helvetica-Bold', 12, 16, PRIMARY, TA_LEFT, 1 * mm),
-        ('QuoteRole', 'Helvetica', 10, 14, TEXT_MUTED, TA_LEFT, 3 * mm),
-        ('QuoteText', 'Helvetica-Oblique', 11, 18, TEXT_DARK, TA_JUSTIFY, 4 * mm),
-        ('StatNumber', 'Helvetica-Bold', 28, 34, PRIMARY, TA_CENTER, 0),
-        ('StatLabel', 'Helvetica', 9.5, 13, TEXT_MUTED, TA_CENTER, 0),
-        ('FooterText', 'Helvetica', 8, 11, TEXT_MUTED, TA_CENTER, 0),
-        ('BulletItem', 'Helvetica', 10.5, 16, TEXT_DARK, TA_LEFT, 2 * mm),
-        ('BulletItemWhite', 'Helvetica', 10.5, 16, HexColor("#E8E8F0"), TA_LEFT, 2 * mm),
-        ('CTATitle', 'Helvetica-Bold', 22, 28, PRIMARY, TA_CENTER, 4 * mm),
-        ('CTABody', 'Helvetica', 12, 18, TEXT_MUTED, TA_CENTER, 3 * mm),
-    ]
-    for name, font, size, lead, color, align, after in defs:
+    for name, font, size, lead, color, align, after in _STYLE_DEFS:
         extra = {}
         if name == 'QuoteText':
             extra = {'leftIndent': 4 * mm, 'rightIndent': 4 * mm}
         if name.startswith('BulletItem'):
             extra = {'leftIndent': 6 * mm, 'bulletIndent': 0}
         styles.add(ParagraphStyle(name=name, fontName=font, fontSize=size,
-                                  leading=lead, textColor=color, alignment=align,
+                                  leading=lead, textColor=getattr(theme, color), alignment=align,
                                   spaceAfter=after, **extra))
-    return styles
+    for name, parent, overrides in _DERIVED_STYLE_DEFS:
+        kw = dict(overrides)
+        if 'textColor' in kw:
+            kw['textColor'] = getattr(theme, kw['textColor'])
+        styles.add(ParagraphStyle(name, parent=styles[parent], **kw))
+    return StyleRegistry(styles.byName, theme)
+
+
+@lru_cache(maxsize=64)
+def get_styles(theme=DEFAULT_THEME):
+    """Return the shared, process-wide StyleRegistry for theme."""
+    return make_styles(theme)
+
+
+# ── Text metrics cache ──
+# Report text repeats across renders: the same words in the same few fonts and
+# mostly the same paragraphs at the same widths. When enabled, word widths,
+# parsed paragraph fragments and line-broken paragraph layouts are kept in
+# bounded, process-wide LRU caches, so a batch worker re-wrapping a paragraph
+# it has seen before only does a lookup. Output is unchanged: every cached
+# value is a pure function of its key.
+
+_string_width = _rl_paragraph.stringWidth
+_text_caches = None  # (widths, frags, layouts) while enabled
+
+
+def enable_text_metrics_cache(max_widths=200_000, max_paragraphs=20_000):
+    """Turn on the process-wide text metrics caches, with fresh statistics.
+
+    max_widths bounds the (word, font, size) width cache, max_paragraphs each
+    of the parsed-fragment and line-break caches; least recently used entries
+    are evicted beyond that. Word widths are cached by swapping the
+    stringWidth used by reportlab's paragraph module, so they also apply to
+    Paragraphs that are not CachedParagraphs.
+    """
+    global _text_caches
+
+    @lru_cache(maxsize=max_widths)
+    def widths(text, font_name, font_size, encoding="utf8"):
+        return _string_width(text, font_name, font_size, encoding)
+
+    @lru_cache(maxsize=max_paragraphs)
+    def frags(text, style, bullet_text):
+        p = Paragraph(text, style, bullet_text)
+        return p.frags, p.bulletText
+
+    @lru_cache(maxsize=max_paragraphs)
+    def layouts(text, style, bullet_text, avail_width):
+        p = CachedParagraph(text, style, bullet_text)
+        Paragraph.wrap(p, avail_width, 0x7fffffff)
+        return p.blPara, p.height, p._wrapWidths
+
+    _text_caches = (widths, frags, layouts)
+    _rl_paragraph.stringWidth = widths
+
+
+def disable_text_metrics_cache():
+    """Drop the text metrics caches and restore reportlab's stringWidth."""
+    global _text_caches
+    _text_caches = None
+    _rl_paragraph.stringWidth = _string_width
+
+
+def text_metrics_stats():
+    """Hits, misses, evictions, size and hit rate per cache ({} when disabled)."""
+    if _text_caches is None:
+        return {}
+    stats = {}
+    for name, cache in zip(("widths", "frags", "layouts"), _text_caches):
+        info = cache.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits, "misses": info.misses,
+            "evictions": info.misses - info.currsize,  # every miss inserts one entry
+            "size": info.currsize, "max_size": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+class CachedParagraph(Paragraph):
+    """Paragraph that takes its parse and line breaks from the text metrics cache.
+
+    Without the cache enabled it is a plain Paragraph. Parts produced by
+    split() are built from fragments rather than text and are never cached;
+    splitting re-parses first, because reportlab edits fragments in place
+    while splitting and cached ones are shared.
+    """
+    def __init__(self, text, style=None, bulletText=None, frags=None, **kw):
+        caches = _text_caches
+        self._cache_key = None
+        if caches is not None and frags is None and style is not None and not kw:
+            bulletText = bulletText or getattr(style, "bulletText", None)
+            self._cache_key = (text, style, bulletText)
+            frags, bulletText = caches[1](text, style, bulletText)
+        Paragraph.__init__(self, text, style, bulletText, frags, **kw)
+
+    def wrap(self, availWidth, availHeight):
+        caches = _text_caches
+        if caches is None or self._cache_key is None or availWidth < _FUZZ:
+            return Paragraph.wrap(self, availWidth, availHeight)
+        self.width = availWidth
+        self.blPara, self.height, self._wrapWidths = caches[2](*self._cache_key, availWidth)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        if self._cache_key is not None:
+            text, style, bullet_text = self._cache_key
+            self._cache_key = None
+            Paragraph.__init__(self, text, style, bullet_text)
+            Paragraph.wrap(self, availWidth, availHeight)
+        return Paragraph.split(self, availWidth, availHeight)
+
+
+# ── Images ──
+# Report images (scan slices, panoramic thumbnails, logos) repeat on many
+# pages and across many reports. Each source is decoded once per placed pixel
+# size, downsampled to the resolution it is shown at, and kept as a
+# ready-to-embed stream in a bounded process-wide cache. Within a document,
+# every placement of the same prepared image draws one shared image XObject.
+
+MMAP_THRESHOLD = 1 << 20  # source files at least this large are memory-mapped, not read
+JPEG_QUALITY = 90  # re-encoding quality for downsampled JPEG sources
+
+_SOURCE_TYPES = (bytes, bytearray, memoryview)
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """Pixel stream ready to embed as a PDF image XObject, with an optional alpha mask.
+
+    key is a digest of the stream, so equal pixels share one XObject whatever
+    their source.
+    """
+    key: str
+    width: int
+    height: int
+    color_space: str
+    filters: tuple
+    data: bytes
+    smask: "PreparedImage | None" = None
+
+    @property
+    def nbytes(self):
+        return len(self.data) + (self.smask.nbytes if self.smask else 0)
+
+
+def _source_key(source):
+    """Identity of an image source: path, size and mtime for files, a digest for bytes."""
+    if isinstance(source, _SOURCE_TYPES):
+        return "sha256:" + hashlib.sha256(source).hexdigest()
+    st = os.stat(source)
+    return f"file:{os.path.realpath(source)}:{st.st_size}:{st.st_mtime_ns}"
+
+
+@contextmanager
+def _open_source(source):
+    """Seekable binary view of source; large files are memory-mapped instead of read."""
+    if isinstance(source, _SOURCE_TYPES):
+        yield io.BytesIO(source)
+        return
+    with open(source, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size < MMAP_THRESHOLD:
+            yield io.BytesIO(fh.read())
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+def _fit_pixels(size, box):
+    """Pixel size of an image of size scaled down to fit box; images are never upsampled."""
+    width, height = size
+    scale = min(box[0] / width, box[1] / height)
+    if scale >= 1:
+        return size
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _stream_key(data):
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def _window_to_8bit(im):
+    """High-bit-depth grayscale ("I", "I;16", "F") in "L", its value range stretched to 0-255.
+
+    A plain convert("L") clamps instead of scaling, so 12- and 16-bit scans
+    (CBCT slices) would come out nearly white.
+    """
+    im = im.convert("F") if im.mode in ("I", "F") else im.convert("I").convert("F")
+    lo, hi = im.getextrema()
+    scale = 255 / (hi - lo) if hi > lo else 0
+    return im.point(lambda v: (v - lo) * scale).convert("L")
+
+
+def _prepare_image(source, box):
+    from PIL import Image
+
+    with _open_source(source) as fh, Image.open(fh) as im:
+        jpeg = im.format == "JPEG"
+        size = _fit_pixels(im.size, box)
+        if jpeg and size == im.size and im.mode in ("L", "RGB"):
+            # Already the right size: embed the JPEG bytes without decoding them.
+            fh.seek(0)
+            data = fh.read()
+            return PreparedImage(_stream_key(data), *size, "DeviceGray" if im.mode == "L" else "DeviceRGB",
+                                 ("DCTDecode",), data)
+        if jpeg:
+            im.draft(im.mode if im.mode in ("L", "RGB") else "RGB", size)  # decode at a reduced scale
+        im.load()
+        alpha = None
+        if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+            im = im.convert("LA" if im.mode == "LA" else "RGBA")
+            alpha = im.getchannel("A")
+            im = im.convert("L" if im.mode == "LA" else "RGB")
+        elif im.mode.startswith("I") or im.mode == "F":
+            im = _window_to_8bit(im)
+        elif im.mode not in ("L", "RGB"):
+            im = im.convert("L" if im.mode == "1" else "RGB")
+        if im.size != size:
+            im = im.resize(size, Image.Resampling.LANCZOS)
+        color_space = "DeviceGray" if im.mode == "L" else "DeviceRGB"
+        if jpeg:
+            out = io.BytesIO()
+            im.save(out, "JPEG", quality=JPEG_QUALITY)
+            data, filters = out.getvalue(), ("DCTDecode",)
+        else:
+            data, filters = zlib.compress(im.tobytes()), ("FlateDecode",)
+        smask = None
+        if alpha is not None and alpha.getextrema() != (255, 255):
+            if alpha.size != size:
+                alpha = alpha.resize(size, Image.Resampling.LANCZOS)
+            mask_data = zlib.compress(alpha.tobytes())
+            smask = PreparedImage(_stream_key(mask_data), *size, "DeviceGray", ("FlateDecode",), mask_data)
+        return PreparedImage(_stream_key(data + (smask.key.encode() if smask else b"")), *size, color_space,
+                             filters, data, smask)
+
+
+class ImageCache:
+    """Size-bounded LRU of PreparedImages shared by every document in the process.
+
+    Entries are keyed by source identity (see _source_key) and requested pixel
+    box; least recently used entries are evicted once their streams exceed
+    max_bytes. Image headers are cached separately so layout never decodes
+    pixels. Thread-safe; counters are returned by stats().
+    """
+    def __init__(self, max_bytes=64 << 20, max_headers=4096):
+        self.max_bytes = max_bytes
+        self.max_headers = max_headers
+        self._images = OrderedDict()
+        self._headers = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def size(self, source, source_key=None):
+        """Pixel (width, height) of source, read from its header.
+
+        source_key is _source_key(source) when the caller already has it.
+        """
+        key = source_key or _source_key(source)
+        with self._lock:
+            size = self._headers.get(key)
+            if size is not None:
+                self._headers.move_to_end(key)
+                return size
+        from PIL import Image
+
+        with _open_source(source) as fh, Image.open(fh) as im:
+            size = im.size
+        with self._lock:
+            self._headers[key] = size
+            if len(self._headers) > self.max_headers:
+                self._headers.popitem(last=False)
+        return size
+
+    def prepare(self, source, box, source_key=None):
+        """PreparedImage of source fitted to the pixel box (width, height); decodes only on a miss."""
+        key = hashlib.sha256(f"{source_key or _source_key(source)}|{box[0]}x{box[1]}".encode()).hexdigest()[:32]
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.counters["hits"] += 1
+                return image
+            self.counters["misses"] += 1
+        image = _prepare_image(source, box)
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = image
+                self._bytes += image.nbytes
+            while self._bytes > self.max_bytes and len(self._images) > 1:
+                _key, old = self._images.popitem(last=False)
+                self._bytes -= old.nbytes
+                self.counters["evictions"] += 1
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._headers.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, images=len(self._images), bytes=self._bytes, max_bytes=self.max_bytes)
+
+
+IMAGE_CACHE = ImageCache()
+
+
+def _image_xobject(image):
+    obj = pdfdoc.PDFImageXObject(image.key)
+    obj.width, obj.height = image.width, image.height
+    obj.bitsPerComponent = 8
+    obj.colorSpace = image.color_space
+    obj._filters = image.filters
+    obj.streamContent = image.data
+    obj.mask = None
+    return obj
+
+
+def image_xobject_name(canvas_obj, image):
+    """Form name drawing image on canvas_obj, embedding it on first use in the document."""
+    doc = canvas_obj._doc
+    name = f"PRImage_{image.key}"
+    regname = pdfdoc.xObjectName(name)
+    if regname not in doc.idToObject:
+        obj = _image_xobject(image)
+        if image.smask is not None:
+            mask_name = pdfdoc.xObjectName(f"PRImage_{image.smask.key}")
+            obj.smask = doc.Reference(doc.idToObject.get(mask_name) or _image_xobject(image.smask), mask_name)
+        doc.Reference(obj, regname)
+    return name
+
+
+class RasterImage(Flowable):
+    """Raster image (scan slice, panoramic thumbnail, logo) placed width points wide.
+
+    Without height the image keeps its aspect ratio; with it, the image is
+    scaled to fit inside width x height. The embedded pixels are downsampled
+    to dpi at the placed size, never upsampled, and come from cache (default
+    IMAGE_CACHE). source is a file path or the encoded image bytes; its
+    identity is taken once here, so bytes are hashed once per flowable
+    rather than on every wrap and draw.
+    """
+    def __init__(self, source, width, height=None, dpi=150, cache=None):
+        Flowable.__init__(self)
+        self.source = source
+        self.source_key = _source_key(source)
+        self.box = (width, height)
+        self.dpi = dpi
+        self.cache = cache
+
+    def wrap(self, availWidth, availHeight):
+        px_w, px_h = (self.cache or IMAGE_CACHE).size(self.source, self.source_key)
+        width, height = self.box
+        scale = width / px_w if height is None else min(width / px_w, height / px_h)
+        self.width, self.height = px_w * scale, px_h * scale
+        return self.width, self.height
+
+    def draw(self):
+        box = (math.ceil(self.width * self.dpi / 72), math.ceil(self.height * self.dpi / 72))
+        image = (self.cache or IMAGE_CACHE).prepare(self.source, box, self.source_key)
+        name = image_xobject_name(self.canv, image)
+        self.canv.saveState()
+        self.canv.scale(self.width, self.height)
+        self.canv.doForm(name)
+        self.canv.restoreState()
 
 
 # ── Page Builders ──
 
-def build_cover(styles):
-    elements = [SetPageBackground("dark")]
-    elements.append(Spacer(1, 35 * mm))
-    elements.append(Paragraph("PRESS RELEASE  |  2026", styles['CoverTag']))
-    elements.append(Spacer(1, 6 * mm))
-    elements.append(Paragraph(
+# Each builder takes the shared StyleRegistry and a normalized content spec
+# (see press_release_spec); spec=None renders the default press release.
+# Builders are generators, so a streaming build only holds the flowables of
+# the page being laid out.
+
+def build_cover(styles, spec=None):
+    spec = spec or normalize_spec()
+    yield SetPageBackground("dark")
+    yield Spacer(1, 35 * mm)
+    yield CachedParagraph(spec["tag"], styles['CoverTag'])
+    yield Spacer(1, 6 * mm)
+    yield CachedParagraph(
         "SOJAI Launches the First<br/>All-in-One AI Platform for<br/>Dental Diagnostics",
-        styles['CoverTitle']))
-    elements.append(Spacer(1, 6 * mm))
-    elements.append(Paragraph(
+        styles['CoverTitle'])
+    yield Spacer(1, 6 * mm)
+    yield CachedParagraph(
         "99.8% accuracy across 130+ pathologies. Full CBCT analysis in under 60 seconds.<br/>"
         "FDA-cleared. HIPAA &amp; GDPR compliant. Trusted by 10,000+ practitioners.",
-        styles['CoverSubtitle']))
-    elements.append(Spacer(1, 15 * mm))
+        styles['CoverSubtitle'])
+    yield Spacer(1, 15 * mm)
 
-    stats = [("99.8%", "Accuracy"), ("130+", "Pathologies"),
-             ("&lt;60s", "Analysis Time"), ("10,000+", "Practitioners")]
+    stats = spec["stats"]
     stat_cells = [[
-        Paragraph(n, styles['StatNumber']),
-        Paragraph(l, ParagraphStyle('SLW', parent=styles['StatLabel'], textColor=HexColor("#B0ADCC")))
+        CachedParagraph(n, styles['StatNumber']),
+        CachedParagraph(l, styles['StatLabelDark'])
     ] for n, l in stats]
-    tbl = Table([stat_cells], colWidths=[PW / 4] * 4, rowHeights=[55])
+    tbl = Table([stat_cells], colWidths=[PW / len(stats)] * len(stats), rowHeights=[55])
     tbl.setStyle(TableStyle([
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
     ]))
-    elements.append(tbl)
-    elements.append(Spacer(1, 20 * mm))
-    elements.append(Paragraph("www.sojai.com  |  contact@sojai.com",
-                              ParagraphStyle('CF', parent=styles['FooterText'], textColor=HexColor("#8885AA"))))
+    yield tbl
+    yield Spacer(1, 20 * mm)
+    yield CachedParagraph(spec["contact"], styles['CoverFooter'])
     # Set next page to light BEFORE the page break
-    elements.append(SetPageBackground("light"))
-    elements.append(PageBreak())
-    return elements
-
-
-def build_announcement(styles):
-    elements = []
-    elements.append(Spacer(1, 5 * mm))
-    elements.append(Paragraph("THE ANNOUNCEMENT", styles['SectionBadge']))
-    elements.append(HLine(60 * mm, PRIMARY, 2.5))
-    elements.append(Spacer(1, 3 * mm))
-    elements.append(Paragraph(
+    yield SetPageBackground("light")
+    yield PageBreak()
+
+
+def build_announcement(styles, spec=None):
+    spec = spec or normalize_spec()
+    t = styles.theme
+    yield Spacer(1, 5 * mm)
+    yield CachedParagraph("THE ANNOUNCEMENT", styles['SectionBadge'])
+    yield HLine(60 * mm, t.primary, 2.5)
+    yield Spacer(1, 3 * mm)
+    yield CachedParagraph(
         "The First All-in-One AI Platform<br/>for Dental Diagnostics",
-        styles['PageTitle']))
-    elements.append(Spacer(1, 2 * mm))
+        styles['PageTitle'])
+    yield Spacer(1, 2 * mm)
 
-    elements.append(Paragraph(
+    yield CachedParagraph(
         "SOJAI, an AI-powered SaaS platform, now enables dental professionals to automatically "
         "analyze CBCT scans and 2D radiographs in under 60 seconds, with 99.8% accuracy across "
         "130+ pathologies. The technology is FDA 510(k) cleared, HIPAA and GDPR compliant, and "
         "already used by over 10,000 practitioners worldwide.",
-        styles['BodyText14']))
-    elements.append(Paragraph(
+        styles['BodyText14'])
+    yield CachedParagraph(
         "The platform covers the entire diagnostic workflow \u2014 from scan upload to a professional "
         "PDF report ready to hand to the patient. Compatible with all 18 major CBCT manufacturers, "
         "SOJAI integrates seamlessly into existing practice infrastructure without requiring any "
         "equipment change.",
-        styles['BodyText14']))
-    elements.append(Spacer(1, 4 * mm))
+        styles['BodyText14'])
+    yield Spacer(1, 4 * mm)
 
     facts = [
         "\u2713  FDA 510(k) cleared for periapical pathology detection",
@@ -235,40 +1108,29 @@ def build_announcement(styles):
         "\u2713  DICOM, panoramic, periapical, bitewing \u2014 all formats supported",
         "\u2713  Cloud-based, accessible from any device, anywhere",
     ]
-    for t in facts:
-        elements.append(Paragraph(f'<font color="{PRIMARY.hexval()}">\u2022</font>  {t}',
-                                  styles['BulletItem']))
-
-    elements.append(Spacer(1, 5 * mm))
-    elements.append(Paragraph("AI DETECTION ACCURACY", styles['SectionBadge']))
-    elements.append(Spacer(1, 1.5 * mm))
-
-    pathologies = [
-        ("Impacted Teeth", 99.5), ("Caries Detection", 99.2),
-        ("Periapical Lesions", 98.7), ("Bone Loss Analysis", 97.9),
-        ("Root Fractures", 96.5), ("Sinus Pathology", 95.8),
-    ]
-    # Wrap all bars in KeepTogether so they don't split
-    bar_elements = []
-    for label, val in pathologies:
-        bar_elements.append(AccuracyBar(label, val, width=PW))
-        bar_elements.append(Spacer(1, 1 * mm))
-    elements.append(KeepTogether(bar_elements))
+    for fact in facts:
+        yield CachedParagraph(f'<font color="{t.primary.hexval()}">\u2022</font>  {fact}',
+                                  styles['BulletItem'])
+
+    yield Spacer(1, 5 * mm)
+    yield CachedParagraph("AI DETECTION ACCURACY", styles['SectionBadge'])
+    yield Spacer(1, 1.5 * mm)
+
+    yield AccuracyChart(spec["pathologies"], width=PW, header=("FINDING", "ACCURACY"), theme=t)
 
     # Set next page to dark BEFORE the page break
-    elements.append(SetPageBackground("dark"))
-    elements.append(PageBreak())
-    return elements
+    yield SetPageBackground("dark")
+    yield PageBreak()
 
 
-def build_problem(styles):
-    elements = []
-    elements.append(Spacer(1, 5 * mm))
-    elements.append(Paragraph("THE PROBLEM", styles['SectionBadgeWhite']))
-    elements.append(HLine(40 * mm, CYAN, 2.5))
-    elements.append(Spacer(1, 3 * mm))
-    elements.append(Paragraph("The Dark Ages of<br/>Dental Diagnostics", styles['PageTitleWhite']))
-    elements.append(Spacer(1, 2 * mm))
+def build_problem(styles, spec=None):
+    t = styles.theme
+    yield Spacer(1, 5 * mm)
+    yield CachedParagraph("THE PROBLEM", styles['SectionBadgeWhite'])
+    yield HLine(40 * mm, t.cyan, 2.5)
+    yield Spacer(1, 3 * mm)
+    yield CachedParagraph("The Dark Ages of<br/>Dental Diagnostics", styles['PageTitleWhite'])
+    yield Spacer(1, 2 * mm)
 
     paragraphs = [
         "Today, a dentist spends an average of 15 to 20 minutes per CBCT scan manually reviewing "
@@ -288,9 +1150,9 @@ def build_problem(styles):
         "they\u2019re seeing, but they can\u2019t show it convincingly.",
     ]
     for p in paragraphs:
-        elements.append(Paragraph(p, styles['BodyTextWhite']))
+        yield CachedParagraph(p, styles['BodyTextWhite'])
 
-    elements.append(Spacer(1, 6 * mm))
+    yield Spacer(1, 6 * mm)
 
     pain_points = [
         ("15\u201320 min per scan", "Manual analysis, annotation & reporting"),
@@ -299,28 +1161,24 @@ def build_problem(styles):
         ("Poor patient communication", "Patients can\u2019t understand raw imaging"),
     ]
     for title, desc in pain_points:
-        elements.append(Paragraph(
-            f'<font color="#00C8C8"><b>{title}</b></font>',
-            ParagraphStyle('PI', parent=styles['BulletItemWhite'], leftIndent=0, bulletIndent=0)))
-        elements.append(Paragraph(desc,
-            ParagraphStyle('PD', parent=styles['BulletItemWhite'],
-                           textColor=HexColor("#A0A0B8"), fontSize=9.5, leftIndent=0)))
-        elements.append(Spacer(1, 1.5 * mm))
+        yield CachedParagraph(
+            f'<font color="{t.cyan.hexval()}"><b>{title}</b></font>', styles['PainTitle'])
+        yield CachedParagraph(desc, styles['PainDesc'])
+        yield Spacer(1, 1.5 * mm)
 
     # Set next page to light BEFORE the page break
-    elements.append(SetPageBackground("light"))
-    elements.append(PageBreak())
-    return elements
+    yield SetPageBackground("light")
+    yield PageBreak()
 
 
-def build_solution(styles):
-    elements = []
-    elements.append(Spacer(1, 5 * mm))
-    elements.append(Paragraph("THE SOLUTION", styles['SectionBadge']))
-    elements.append(HLine(50 * mm, PRIMARY, 2.5))
-    elements.append(Spacer(1, 3 * mm))
-    elements.append(Paragraph("Three Steps to Transform<br/>Your Practice", styles['PageTitle']))
-    elements.append(Spacer(1, 2 * mm))
+def build_solution(styles, spec=None):
+    t = styles.theme
+    yield Spacer(1, 5 * mm)
+    yield CachedParagraph("THE SOLUTION", styles['SectionBadge'])
+    yield HLine(50 * mm, t.primary, 2.5)
+    yield Spacer(1, 3 * mm)
+    yield CachedParagraph("Three Steps to Transform<br/>Your Practice", styles['PageTitle'])
+    yield Spacer(1, 2 * mm)
 
     steps = [
         ("01 \u2014 Upload Scan",
@@ -339,16 +1197,14 @@ def build_solution(styles):
          "practice logo, and digital signature \u2014 ready to hand to the patient or send to a colleague."),
     ]
 
-    step_style = ParagraphStyle('StepT', parent=styles['BodyText14'], fontSize=12.5,
-                                fontName='Helvetica-Bold', textColor=PRIMARY, spaceAfter=1.5 * mm)
     for title, body in steps:
-        elements.append(Paragraph(title, step_style))
-        elements.append(Paragraph(body, styles['BodyText14']))
-        elements.append(Spacer(1, 2 * mm))
+        yield CachedParagraph(title, styles['StepTitle'])
+        yield CachedParagraph(body, styles['BodyText14'])
+        yield Spacer(1, 2 * mm)
 
-    elements.append(Spacer(1, 4 * mm))
-    elements.append(Paragraph("PLATFORM CAPABILITIES", styles['SectionBadge']))
-    elements.append(Spacer(1, 2 * mm))
+    yield Spacer(1, 4 * mm)
+    yield CachedParagraph("PLATFORM CAPABILITIES", styles['SectionBadge'])
+    yield Spacer(1, 2 * mm)
 
     # Build capabilities as a single KeepTogether table
     col_w = PW / 3
@@ -365,15 +1221,10 @@ def build_solution(styles):
          "PACS integration, batch<br/>processing, DICOM &amp;<br/>STL/OBJ support"],
     ]
 
-    ft_style = ParagraphStyle('FT', fontName='Helvetica-Bold', fontSize=9.5,
-                              leading=13, textColor=PRIMARY, alignment=TA_CENTER)
-    fd_style = ParagraphStyle('FD', fontName='Helvetica', fontSize=8.5,
-                              leading=12, textColor=TEXT_MUTED, alignment=TA_CENTER)
-
     rows = []
     for i in range(2):
-        rows.append([Paragraph(f'<b>{t}</b>', ft_style) for t in feat_titles[i]])
-        rows.append([Paragraph(d, fd_style) for d in feat_descs[i]])
+        rows.append([CachedParagraph(f'<b>{title}</b>', styles['FeatureTitle']) for title in feat_titles[i]])
+        rows.append([CachedParagraph(d, styles['FeatureDesc']) for d in feat_descs[i]])
 
     tbl = Table(rows, colWidths=[col_w] * 3)
     tbl.setStyle(TableStyle([
@@ -383,94 +1234,673 @@ def build_solution(styles):
         ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
         ('LEFTPADDING', (0, 0), (-1, -1), 6),
         ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT_BG),
-        ('LINEBELOW', (0, 1), (-1, 1), 0.5, HexColor("#E0E0E5")),
+        ('BACKGROUND', (0, 0), (-1, -1), t.light_bg),
+        ('LINEBELOW', (0, 1), (-1, 1), 0.5, t.rule),
     ]))
-    elements.append(KeepTogether([tbl]))
+    yield KeepTogether([tbl])
 
-    elements.append(PageBreak())
-    return elements
+    yield PageBreak()
 
 
-def build_quotes(styles):
-    elements = []
-    elements.append(Spacer(1, 5 * mm))
-    elements.append(Paragraph("WHAT PRACTITIONERS SAY", styles['SectionBadge']))
-    elements.append(HLine(70 * mm, PRIMARY, 2.5))
-    elements.append(Spacer(1, 3 * mm))
-    elements.append(Paragraph("Trusted by Dental<br/>Professionals Worldwide", styles['PageTitle']))
-    elements.append(Spacer(1, 5 * mm))
-
-    # Quote 1
-    elements.append(Paragraph(
-        "\u201cThe pathology detection has changed my daily practice. Last week, SOJAI flagged a root "
-        "fracture on a lower first molar that I would have probably diagnosed as irreversible pulpitis. "
-        "And the PDF reports \u2014 my patients finally understand what I\u2019m showing them. Treatment plan "
-        "acceptance rates have gone up significantly since we started using the platform.\u201d",
-        styles['QuoteText']))
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(Paragraph("Dr. Sarah Chen", styles['QuoteName']))
-    elements.append(Paragraph("Oral Surgeon \u2014 Boston, MA", styles['QuoteRole']))
-
-    elements.append(Spacer(1, 8 * mm))
-    elements.append(HLine(30 * mm, BADGE_BG, 1.5))
-    elements.append(Spacer(1, 8 * mm))
-
-    # Quote 2
-    elements.append(Paragraph(
-        "\u201cIntegration with our Planmeca CBCT took literally five minutes. But what really sold me "
-        "is the 3D segmentation: being able to isolate a tooth, trace the root canal in 3D, and "
-        "export to STL for planning an endo retreatment \u2014 that\u2019s a massive time saver. We\u2019ve cut "
-        "our pre-operative planning time in half.\u201d",
-        styles['QuoteText']))
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(Paragraph("Dr. Emma Larsson", styles['QuoteName']))
-    elements.append(Paragraph("Endodontist \u2014 Stockholm, Sweden", styles['QuoteRole']))
-
-    elements.append(Spacer(1, 15 * mm))
+def build_quotes(styles, spec=None):
+    spec = spec or normalize_spec()
+    t = styles.theme
+    yield Spacer(1, 5 * mm)
+    yield CachedParagraph("WHAT PRACTITIONERS SAY", styles['SectionBadge'])
+    yield HLine(70 * mm, t.primary, 2.5)
+    yield Spacer(1, 3 * mm)
+    yield CachedParagraph("Trusted by Dental<br/>Professionals Worldwide", styles['PageTitle'])
+    yield Spacer(1, 5 * mm)
+
+    for i, quote in enumerate(spec["quotes"]):
+        if i:
+            yield Spacer(1, 8 * mm)
+            yield HLine(30 * mm, t.badge_bg, 1.5)
+            yield Spacer(1, 8 * mm)
+        yield CachedParagraph(quote["text"], styles['QuoteText'])
+        yield Spacer(1, 2 * mm)
+        yield CachedParagraph(quote["name"], styles['QuoteName'])
+        yield CachedParagraph(quote["role"], styles['QuoteRole'])
+
+    yield Spacer(1, 15 * mm)
 
     # CTA
-    elements.append(HLine(PW, LIGHT_BG, 1))
-    elements.append(Spacer(1, 8 * mm))
-    elements.append(Paragraph("Ready to Transform Your Practice?", styles['CTATitle']))
-    elements.append(Paragraph(
-        "Join 10,000+ dental professionals using AI-powered diagnostics.", styles['CTABody']))
-    elements.append(Paragraph(
+    yield HLine(PW, t.light_bg, 1)
+    yield Spacer(1, 8 * mm)
+    yield CachedParagraph("Ready to Transform Your Practice?", styles['CTATitle'])
+    yield CachedParagraph(
+        "Join 10,000+ dental professionals using AI-powered diagnostics.", styles['CTABody'])
+    yield CachedParagraph(
         "Free 14-day trial  \u2022  No credit card required  \u2022  HIPAA compliant",
-        ParagraphStyle('CS', parent=styles['CTABody'], fontSize=10, textColor=TEXT_MUTED)))
-    elements.append(Spacer(1, 8 * mm))
-    elements.append(Paragraph("www.sojai.com  |  contact@sojai.com  |  Book a Demo",
-                              styles['FooterText']))
-    return elements
+        styles['CTASmall'])
+    yield Spacer(1, 8 * mm)
+    yield CachedParagraph(f"{spec['contact']}  |  Book a Demo", styles['FooterText'])
 
 
-def build_pdf():
-    global _current_bg
-    _current_bg = "dark"  # Cover starts dark
-    _page_counter[0] = 0
+SECTION_BUILDERS = (build_cover, build_announcement, build_problem, build_solution, build_quotes)
 
-    output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SOJAI_Press_Release.pdf")
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SOJAI_Press_Release.pdf")
 
-    doc = SimpleDocTemplate(
-        output_path, pagesize=A4,
+
+def make_doc_template(output_path, spec, theme, background_forms=True, page_total=True, output_profile=None):
+    """PressReleaseDocTemplate configured for a normalized spec.
+
+    output_profile (a name or OutputProfile) defaults to the spec's "output_profile".
+    """
+    return PressReleaseDocTemplate(
+        output_path, initial_bg="dark", theme=theme,  # Cover starts dark
+        background_forms=background_forms, footer=spec["footer"], page_total=page_total,
+        output_profile=output_profile or spec["output_profile"],
+        pagesize=A4,
         leftMargin=MARGIN_LR, rightMargin=MARGIN_LR,
         topMargin=MARGIN_TB, bottomMargin=MARGIN_TB,
-        title="SOJAI - Press Release 2026", author="SOJAI",
+        title=spec["title"], author=spec["author"],
     )
 
-    styles = get_styles()
+
+def build_pdf(output_path=None, verbose=True, theme=None, background_forms=True, spec=None,
+              profile=None, sections=None, stream=False, page_total=True, output_profile=None):
+    """Render the press release.
+
+    output_path is a file path (defaults to DEFAULT_OUTPUT) or any writable
+    binary stream such as io.BytesIO; the path or stream is returned. spec is
+    a content spec (see press_release_spec); theme overrides its palette.
+    Pass a RenderProfiler as profile to record per-flowable and per-page timings.
+
+    sections is an iterable of section builders (default SECTION_BUILDERS),
+    consumed lazily. With stream=True flowables are pulled from the builders
+    only as layout needs them and each finished page is written to
+    output_path straight away (see StreamingCanvas), so memory stays flat
+    however many sections a report has. page_total=False drops the page count
+    from the footer ("Page X" instead of "Page X of Y"). output_profile ("fast",
+    "smallest" or an OutputProfile) overrides the spec's "output_profile".
+    """
+    output_path = output_path or DEFAULT_OUTPUT
+    spec = normalize_spec(spec)
+    theme = theme or theme_from_spec(spec)
+
+    doc = make_doc_template(output_path, spec, theme, background_forms, page_total, output_profile)
+    styles = get_styles(theme)
+    elements = chain.from_iterable(builder(styles, spec) for builder in (sections or SECTION_BUILDERS))
+
+    page_cb = on_page
+    if profile is not None:
+        elements = (profile.instrument((f,))[0] for f in elements)
+        page_cb = profile.page_callback(on_page)
+    if stream:
+        try:
+            doc.build(FlowableStream(elements), onFirstPage=page_cb, onLaterPages=page_cb,
+                      canvasmaker=StreamingCanvas)
+        except BaseException:
+            if getattr(doc, "canv", None) is not None:
+                doc.canv.abort()
+            raise
+    else:
+        doc.build(list(elements), onFirstPage=page_cb, onLaterPages=page_cb)
+    if profile is not None:
+        profile.finish()
+    if verbose and not hasattr(output_path, "write"):
+        print(f"PDF generated: {output_path}")
+    return output_path
+
+
+# ── Streaming build ──
+
+class FlowableStream:
+    """List-like front of a lazily produced flowable iterator, for doc.build().
+
+    BaseDocTemplate.build consumes flowables from the front, pushes split
+    remainders back with insert() and slice assignment, and peeks a few items
+    ahead for keepWithNext chains. Only a small window of the iterator is
+    buffered, and flowables are released once they have been drawn.
+    """
+    def __init__(self, flowables, lookahead=16):
+        self._it = iter(flowables)
+        self._buf = []
+        self.lookahead = lookahead
+
+    def _fill(self, n):
+        buf = self._buf
+        while len(buf) < n and self._it is not None:
+            try:
+                buf.append(next(self._it))
+            except StopIteration:
+                self._it = None
+
+    def _fill_for(self, index):
+        if isinstance(index, slice):
+            stop = index.stop
+            self._fill(stop if stop is not None and stop >= 0 else self.lookahead)
+        else:
+            self._fill(index + 1 if index >= 0 else self.lookahead)
+
+    def __len__(self):
+        self._fill(self.lookahead)
+        return len(self._buf)
+
+    def __getitem__(self, index):
+        self._fill_for(index)
+        return self._buf[index]
+
+    def __delitem__(self, index):
+        self._fill_for(index)
+        del self._buf[index]
+
+    def __setitem__(self, index, value):
+        self._buf[index] = value
+
+    def insert(self, index, value):
+        self._buf.insert(index, value)
+
+
+class StreamingCanvas(Canvas):
+    """Canvas that writes every page to the output as soon as it is finished.
+
+    A stock Canvas keeps all pages until save() and then serializes the file
+    in memory. Here each page dictionary and its content stream are formatted
+    at showPage, written out and replaced by a reference, leaving only their
+    xref offsets behind; the shared objects (fonts, background forms, page
+    tree, catalog, info) follow at save(). Encryption is not supported.
+    """
+    def __init__(self, filename, *args, **kw):
+        if kw.get("encrypt"):
+            raise ValueError("StreamingCanvas does not support encryption")
+        Canvas.__init__(self, filename, *args, **kw)
+        if hasattr(filename, "write"):
+            self._out, self._owns_out = filename, False
+        else:
+            self._out, self._owns_out = open(filename, "wb"), True
+        self._offset = 0
+        self._written = set()
+        # Register the page tree up front: the first page's /Parent would
+        # otherwise register it mid-showPage and it would be flushed with
+        # that page, listing a single kid.
+        self._doc.Reference(self._doc.Pages)
+        self._emit(pdfdoc.PDFFile(self._doc._pdfVersion).format(self._doc))
+
+    def _emit(self, data):
+        offset = self._offset
+        self._out.write(data)
+        self._offset += len(data)
+        return offset
+
+    def _write_object(self, name):
+        doc = self._doc
+        obj = doc.idToObject[name]
+        doc.idToOffset[name] = self._emit(pdfdoc.PDFIndirectObject(name, obj).format(doc))
+        doc.idToObject[name] = None  # keep the name registered, release the object
+        self._written.add(name)
+
+    def showPage(self):
+        Canvas.showPage(self)
+        doc = self._doc
+        pages = doc.Pages.pages
+        name = pages[-1].__InternalName__
+        first_new = doc.objectcounter + 1
+        self._write_object(name)
+        # Objects the page registered while being formatted: its content stream.
+        for number in range(first_new, doc.objectcounter + 1):
+            self._write_object(doc.numberToId[number])
+        pages[-1] = pdfdoc.PDFObjectReference(name)
+
+    def save(self):
+        """Write the remaining objects, the xref table and the trailer, then close."""
+        if len(self._code):
+            self.showPage()
+        doc = self._doc
+        # Same preparation as PDFDocument.GetPDFData.
+        for font in doc.delayedFonts:
+            font.addObjects(doc)
+        doc.info.invariant = doc.invariant
+        doc.info.digest(doc.signature)
+        doc.Reference(doc.Catalog)
+        doc.Reference(doc.info)
+        doc.Outlines.prepare(doc, self)
+        if doc.Outlines.ready < 0:
+            doc.Catalog.Outlines = None
+
+        number = 1
+        while number in doc.numberToId:  # formatting may register more objects
+            name = doc.numberToId[number]
+            if name not in self._written:
+                self._write_object(name)
+            number += 1
+        xref = pdfdoc.PDFCrossReferenceTable()
+        xref.addsection(0, [doc.numberToId[n] for n in range(1, number)])
+        startxref = self._emit(xref.format(doc))
+        self._emit(pdfdoc.PDFTrailer(
+            startxref=startxref, Size=number, Root=doc.Reference(doc.Catalog),
+            Info=doc.Reference(doc.info), Encrypt=None, ID=doc.ID()).format(doc))
+        if self._owns_out:
+            self._out.close()
+
+    def abort(self):
+        """Close an output file opened by the canvas after a failed build."""
+        if self._owns_out and not self._out.closed:
+            self._out.close()
+
+
+# ── Layout once, paint many ──
+# Content is laid out once against SENTINEL_THEME, whose colour slots are all
+# distinct, while recording where each top-level flowable lands. A variant is
+# then painted by replaying those draws on a canvas that maps sentinel colours
+# to the variant's theme, so no Paragraph or Table is wrapped or split again.
+
+_COLOR_SLOTS = [f.name for f in fields(Theme) if f.name != "name"]
+SENTINEL_THEME = Theme(name="__layout__", **{
+    slot: HexColor(f"#5AA5{i:02X}") for i, slot in enumerate(_COLOR_SLOTS)})
+
+# Spec keys that never affect layout: the palette, the footer drawn by
+# on_page, document metadata, the batch file name and the output profile.
+_PAINT_ONLY_KEYS = ("theme", "footer", "title", "author", "output", "output_profile")
+
+
+def layout_key(spec):
+    """The part of a normalized spec that determines line and page breaks."""
+    return {k: v for k, v in spec.items() if k not in _PAINT_ONLY_KEYS}
+
+
+class DocumentLayout:
+    """Pagination of a spec: per page, its background and the placed flowables."""
+    def __init__(self, spec):
+        self.spec = spec
+        self.key = layout_key(spec)
+        self.pages = []  # [background, [(flowable, x, y, sW), ...]]
+
+    def _record(self, flowables):
+        for f in flowables:
+            if isinstance(f, Flowable) and not f.__dict__.get("_layout_recorded"):
+                f._layout_recorded = True
+                f.drawOn = self._recorder(f)
+                split = getattr(f, "split", None)
+                if split is not None:
+                    f.split = self._split_recorder(f, split)
+        return flowables
+
+    def _recorder(self, flowable):
+        def draw_on(canvas_obj, x, y, _sW=0):
+            if isinstance(flowable, SetPageBackground):
+                type(flowable).drawOn(flowable, canvas_obj, x, y, _sW)  # updates doc.current_bg
+            self.pages[-1][1].append((flowable, x, y, _sW))
+        return draw_on
+
+    def _split_recorder(self, flowable, split):
+        def recorded_split(*args):
+            return self._record(split(*args))
+        return recorded_split
+
+    def _page_begin(self, canvas_obj, doc):
+        doc.page_counter += 1
+        self.pages.append([doc.current_bg, []])
+
+
+def layout_document(spec=None):
+    """Run wrap/split for spec without drawing or serializing anything."""
+    spec = normalize_spec(spec)
+    layout = DocumentLayout(spec)
+    doc = make_doc_template(io.BytesIO(), spec, SENTINEL_THEME)
+    doc._doSave = 0
+    styles = get_styles(SENTINEL_THEME)
+    elements = []
+    for builder in SECTION_BUILDERS:
+        elements.extend(builder(styles, spec))
+    doc.build(layout._record(elements), onFirstPage=layout._page_begin, onLaterPages=layout._page_begin)
+    return layout
+
+
+def _palette_mapper(theme):
+    mapping = {getattr(SENTINEL_THEME, slot).hexval(): getattr(theme, slot) for slot in _COLOR_SLOTS}
+
+    def to_theme(color):
+        if isinstance(color, Color):
+            return mapping.get(color.hexval(), color)
+        return color
+    return to_theme
+
+
+def paint_layout(layout, output_path, theme=None, spec=None, background_forms=True):
+    """Draw a recorded layout with theme; spec supplies footer and metadata.
+
+    spec must share layout.key (see render_variants). Painting reuses the
+    layout's flowables, so paint a given layout from one thread at a time.
+    Returns output_path.
+    """
+    spec = spec or layout.spec
+    theme = theme or theme_from_spec(spec)
+    doc = make_doc_template(output_path, spec, theme, background_forms)
+    canv = doc._makeCanvas(output_path)
+    canv._enforceColorSpace = _palette_mapper(theme)
+    canv._doctemplate = doc
+    for page, (background, placements) in enumerate(layout.pages):
+        doc.current_bg = background
+        doc.page_counter = page
+        on_page(canv, doc)
+        for flowable, x, y, sW in placements:
+            type(flowable).drawOn(flowable, canv, x, y, _sW=sW)
+        if doc.lean_drawing:
+            drop_redundant_ops(canv)
+        canv.showPage()
+    canv.save()
+    return output_path
+
+
+def render_variants(spec, variants, background_forms=True):
+    """Render spec once per variant and return the PDFs as bytes, in order.
+
+    Each variant is a partial spec merged over spec, typically a "theme",
+    "footer" or "title" override. Variants that leave layout_key() unchanged
+    share one layout and only pay for drawing; any other change (text, stats,
+    rows...) could move line or page breaks, so it falls back to a full build.
+    """
+    base = normalize_spec(spec)
+    layout = None
+    results = []
+    for variant in variants:
+        variant_spec = normalize_spec({**base, **variant})
+        if layout_key(variant_spec) == layout_key(base):
+            layout = layout or layout_document(base)
+            buf = paint_layout(layout, io.BytesIO(), spec=variant_spec, background_forms=background_forms)
+        else:
+            buf = build_pdf(io.BytesIO(), verbose=False, background_forms=background_forms, spec=variant_spec)
+        results.append(buf.getvalue())
+    return results
+
+
+# ── Dry run ──
+
+class _PageMapLayout(DocumentLayout):
+    """DocumentLayout that also tracks sections, frame space and KeepTogether overflow."""
+    def __init__(self, spec):
+        DocumentLayout.__init__(self, spec)
+        self.remaining = []  # free frame height at the end of each page
+        self.overflows = []
+        self.frame = None  # frame of the current page
+
+    def tag(self, flowables, section):
+        for index, f in enumerate(flowables):
+            f._page_map_origin = (section, index, False)
+            yield f
+
+    def _record(self, flowables):
+        for f in flowables:
+            if isinstance(f, Flowable) and not f.__dict__.get("_layout_recorded"):
+                f.wrap = self._size_recorder(f, f.wrap)
+        return DocumentLayout._record(self, flowables)
+
+    @staticmethod
+    def _size_recorder(flowable, wrap):
+        def recorded_wrap(*args):
+            size = wrap(*args)
+            flowable._page_map_height = size[1]
+            return size
+        return recorded_wrap
+
+    def _split_recorder(self, flowable, split):
+        recorded_split = DocumentLayout._split_recorder(self, flowable, split)
+
+        def tagged_split(*args):
+            parts = recorded_split(*args)
+            section, index, continued = getattr(flowable, "_page_map_origin", (None, None, False))
+            keep_together = isinstance(flowable, KeepTogether)
+            for n, part in enumerate(parts):
+                part._page_map_origin = (section, index, continued or (n > 0 and not keep_together))
+            if keep_together and flowable._H > self.frame._aH:
+                self.overflows.append({"section": section, "index": index, "page": len(self.pages),
+                                       "height": round(flowable._H, 2),
+                                       "frame_height": round(self.frame._aH, 2)})
+            return parts
+        return tagged_split
+
+    def _page_begin(self, canvas_obj, doc):
+        if self.frame is not None:  # frames are reset after onPage: this is the finished page
+            self.remaining.append(self.frame._y - self.frame._y1p)
+        self.frame = doc.pageTemplate.frames[0]
+        DocumentLayout._page_begin(self, canvas_obj, doc)
+
+
+def dry_run(spec=None, sections=None):
+    """Paginate spec with wrap/split only and return its page map.
+
+    Nothing is drawn, no background is painted and no PDF is serialized,
+    which makes this a cheap pre-flight check for pagination drift. The page
+    map is JSON-compatible:
+
+    - pages: per page its background, the free frame height left at the
+      bottom (points) and the flowables placed on it, each with its section,
+      index within the section, type, y, height and whether it is the
+      continuation of a flowable split from an earlier page;
+    - sections: first and last page and page count of each section;
+    - overflows: KeepTogether blocks taller than a whole frame, which
+      reportlab has to split despite the KeepTogether.
+    """
+    spec = normalize_spec(spec)
+    layout = _PageMapLayout(spec)
+    doc = make_doc_template(io.BytesIO(), spec, SENTINEL_THEME)  # the palette never moves a break
+    doc._doSave = 0
+    styles = get_styles(SENTINEL_THEME)
     elements = []
-    elements.extend(build_cover(styles))
-    elements.extend(build_announcement(styles))
-    elements.extend(build_problem(styles))
-    elements.extend(build_solution(styles))
-    elements.extend(build_quotes(styles))
-
-    doc.build(elements, onFirstPage=on_page, onLaterPages=on_page)
-    print(f"PDF generated: {output_path}")
+    for builder in (sections or SECTION_BUILDERS):
+        elements.extend(layout.tag(builder(styles, spec), builder.__name__))
+    doc.build(layout._record(elements), onFirstPage=layout._page_begin, onLaterPages=layout._page_begin)
+    layout.remaining.append(layout.frame._y - layout.frame._y1p)
+
+    pages = []
+    section_pages = {}
+    for number, ((background, placements), remaining) in enumerate(zip(layout.pages, layout.remaining), 1):
+        placed = []
+        for f, _x, y, _sW in placements:
+            origin = getattr(f, "_page_map_origin", None)
+            if origin is None:
+                continue
+            section, index, continued = origin
+            placed.append({"section": section, "index": index, "type": type(f).__name__,
+                           "y": round(y, 2), "height": round(getattr(f, "_page_map_height", 0), 2),
+                           "continued": continued})
+            first_last = section_pages.setdefault(section, [number, number])
+            first_last[1] = number
+        pages.append({"page": number, "background": background,
+                      "remaining": round(remaining, 2), "flowables": placed})
+    return {
+        "page_count": len(pages),
+        "pages": pages,
+        "sections": [{"section": name, "first_page": first, "last_page": last, "pages": last - first + 1}
+                     for name, (first, last) in section_pages.items()],
+        "overflows": layout.overflows,
+    }
+
+
+# ── In-memory output ──
+
+def render_pdf_bytes(as_view=False, spec=None):
+    """Render the press release in memory, without touching the filesystem.
+
+    Returns the PDF as bytes, or as a zero-copy memoryview over the render
+    buffer when as_view is True.
+    """
+    buf = build_pdf(io.BytesIO(), verbose=False, spec=spec)
+    return buf.getbuffer() if as_view else buf.getvalue()
+
+
+def iter_pdf_chunks(chunk_size=64 * 1024, spec=None):
+    """Yield the rendered PDF in chunk_size pieces for a streaming response.
+
+    reportlab serializes the whole document when the canvas is saved, so the
+    first chunk is available once layout finishes; the chunks are then cut
+    from the in-memory buffer without a further copy of the document.
+    """
+    view = render_pdf_bytes(as_view=True, spec=spec)
+    try:
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+    finally:
+        view.release()
+
+
+# ── Concurrent rendering ──
+
+def _render_spec(spec):
+    if isinstance(spec, (str, os.PathLike)):
+        spec = {"output_path": spec}
+    if not spec.get("output_path"):
+        # Never fall back to DEFAULT_OUTPUT here: concurrent workers would all write one file.
+        return build_pdf(**{"verbose": False, **spec, "output_path": io.BytesIO()}).getvalue()
+    return build_pdf(**{"verbose": False, **spec})
+
+
+def render_many(specs, workers=None, processes=True):
+    """Render several documents concurrently.
+
+    Each spec is either an output path or a dict of build_pdf() keyword
+    arguments; a dict without an output_path is rendered in memory and its
+    result is the PDF bytes. Renders are CPU bound, so a process pool is used
+    by default to scale with cores; pass processes=False for a thread pool
+    (cheaper to start, but bounded by the GIL). Returns the results in spec
+    order.
+    """
+    executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor(max_workers=workers) as pool:
+        return list(pool.map(_render_spec, specs))
+
+
+# ── Parallel sections ──
+# Every section ends at a hard PageBreak, so sections lay out independently.
+# Workers lay out and draw one section each and hand back the raw operators of
+# its pages; the parent draws the page chrome (background, footer with the
+# global page number) and splices the section operators into one document.
+
+def _prime_fonts(canvas_obj):
+    """Register the standard fonts in a fixed order so internal font names
+    (/F1, /F2...) agree between the worker and parent canvases."""
+    for name in standardFonts:
+        canvas_obj._doc.getInternalFontName(name)
+
+
+def _page_is_portable(page):
+    """True when a page's operators need no resources beyond the shared fonts.
+
+    Images and forms show up as XObjects; hasImages is always set by reportlab.
+    """
+    return not (page.ExtGState or page.XObjects or page.Annots
+                or page._colorsUsed or page._shadingUsed)
+
+
+class _SectionCanvas(Canvas):
+    """Canvas that keeps each page's drawing operators for splicing elsewhere."""
+    def __init__(self, *args, **kw):
+        Canvas.__init__(self, *args, **kw)
+        _prime_fonts(self)
+        self.section_pages = []  # (operators, portable)
+        self.section_bookmarks = []  # (page index, key, keyword arguments)
+        self.section_outline = []  # addOutlineEntry arguments
+
+    def showPage(self):
+        ops = "\n".join(self._code)
+        Canvas.showPage(self)
+        self.section_pages.append((ops, _page_is_portable(self._doc.Pages.pages[-1])))
+
+    def bookmarkPage(self, key, **kw):
+        self.section_bookmarks.append((len(self.section_pages), key, kw))
+        return Canvas.bookmarkPage(self, key, **kw)
+
+    def addOutlineEntry(self, title, key, level=0, closed=None):
+        self.section_outline.append((title, key, level, closed))
+        Canvas.addOutlineEntry(self, title, key, level, closed)
+
+
+def _render_section(spec, theme, builder):
+    """Lay out and draw one section; returns its pages and page-independent state.
+
+    Pages record the background requested so far in the section, or None when
+    it is inherited from the previous section.
+    """
+    doc = make_doc_template(io.BytesIO(), spec, theme)
+    doc.current_bg = None
+    doc._doSave = 0
+    backgrounds = []
+
+    def page_begin(canvas_obj, doc):
+        backgrounds.append(doc.current_bg)
+
+    doc.build(list(builder(get_styles(theme), spec)), onFirstPage=page_begin, onLaterPages=page_begin,
+              canvasmaker=_SectionCanvas)
+    canv = doc.canv
+    return {
+        "pages": [(bg, ops) for bg, (ops, _portable) in zip(backgrounds, canv.section_pages)],
+        "portable": all(portable for _ops, portable in canv.section_pages)
+                    and canv._doc.fontMapping.keys() <= set(standardFonts),
+        "end_bg": doc.current_bg,
+        "bookmarks": canv.section_bookmarks,
+        "outline": canv.section_outline,
+    }
+
+
+def build_pdf_parallel(output_path=None, verbose=True, theme=None, background_forms=True, spec=None,
+                       sections=None, workers=None):
+    """Render like build_pdf(), laying out and drawing sections in worker processes.
+
+    Page numbers, backgrounds, bookmarks and the outline are assigned when the
+    sections are merged, so no layout pre-pass is needed. sections must be
+    module-level builders (they are pickled to the workers). A section that
+    draws with page resources of its own (alpha, images, links) cannot be
+    spliced; the document is then rendered by build_pdf() instead.
+    """
+    output_path = output_path or DEFAULT_OUTPUT
+    spec = normalize_spec(spec)
+    theme = theme or theme_from_spec(spec)
+    sections = list(sections or SECTION_BUILDERS)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_render_section, repeat(spec), repeat(theme), sections))
+    if not all(r["portable"] for r in results):
+        return build_pdf(output_path, verbose, theme, background_forms, spec, sections=sections)
+
+    doc = make_doc_template(output_path, spec, theme, background_forms)
+    canv = doc._makeCanvas(output_path)
+    _prime_fonts(canv)
+    canv._doctemplate = doc
+    current_bg = doc.current_bg
+    for result in results:
+        bookmarks = {}
+        for index, key, kw in result["bookmarks"]:
+            bookmarks.setdefault(index, []).append((key, kw))
+        for index, (bg, ops) in enumerate(result["pages"]):
+            current_bg = bg or current_bg
+            doc.current_bg = current_bg
+            canv.saveState()
+            on_page(canv, doc)
+            canv.restoreState()
+            canv._code.append(ops)
+            for key, kw in bookmarks.get(index, ()):
+                canv.bookmarkPage(key, **kw)
+            canv.showPage()
+        current_bg = result["end_bg"] or current_bg
+        for entry in result["outline"]:
+            canv.addOutlineEntry(*entry)
+    canv.save()
+    if verbose and not hasattr(output_path, "write"):
+        print(f"PDF generated: {output_path}")
     return output_path
 
 
 if __name__ == "__main__":
-    path = build_pdf()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the SOJAI press release PDF.")
+    parser.add_argument("--output", default=None, help=f"output path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--profile", metavar="TRACE_JSON",
+                        help="record layout/draw timings, write a Chrome trace and print the top calls")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the page map as JSON instead of rendering (see dry_run)")
+    parser.add_argument("--output-profile", choices=OUTPUT_PROFILE_NAMES,
+                        help="stream compression profile (default: reportlab's stream settings)")
+    args = parser.parse_args()
+    if args.dry_run:
+        print(json.dumps(dry_run(), indent=2))
+        raise SystemExit(0)
+
+    profiler = RenderProfiler() if args.profile else None
+    path = build_pdf(args.output, profile=profiler, output_profile=args.output_profile)
+    if profiler:
+        profiler.write_chrome_trace(args.profile)
+        print(profiler.format_summary())
+        print(f"Trace written: {args.profile}")
     print(f"Done! Open: {path}")
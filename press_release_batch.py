@@ -0,0 +1,154 @@
+"""
+Batch rendering of SOJAI press release PDFs from a JSONL or CSV manifest.
+
+    python press_release_batch.py manifest.jsonl --out-dir reports --workers 8
+    python press_release_batch.py manifest.jsonl --out-dir pagemaps --dry-run
+    python press_release_batch.py manifest.jsonl --out-dir reports --output-profile fast
+
+Specs (see press_release_spec) are streamed from the manifest and fanned out
+to a pool of worker processes; each worker imports reportlab and warms the
+style registry once. At most --max-in-flight specs are held at a time, so
+memory stays bounded however long the manifest is (apart from one output
+name per entry, kept to refuse duplicates). With --dry-run each entry
+is only paginated and its page map (see generate_press_release_pdf.dry_run)
+is written as JSON instead of a PDF. --output-profile sets the output profile
+for entries whose spec does not name one.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from press_release_spec import OUTPUT_PROFILE_NAMES, iter_manifest, load_spec
+
+
+def _init_worker():
+    import generate_press_release_pdf as gen
+    gen.get_styles()
+    gen.enable_text_metrics_cache()
+
+
+def _output_path(line_no, spec, out_dir, dry_run=False):
+    path = os.path.join(out_dir, os.path.basename(spec["output"] or f"report_{line_no:06d}.pdf"))
+    return os.path.splitext(path)[0] + ".pagemap.json" if dry_run else path
+
+
+def _render_entry(line_no, spec, path, dry_run=False):
+    """Render one normalized spec to path; returns (line_no, path, seconds, error)."""
+    import generate_press_release_pdf as gen
+    start = time.perf_counter()
+    tmp = f"{path}.{os.getpid()}.part"
+    try:
+        if dry_run:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(gen.dry_run(spec), fh)
+        else:
+            gen.build_pdf(tmp, verbose=False, spec=spec)
+        os.replace(tmp, path)
+        return line_no, path, time.perf_counter() - start, None
+    except Exception as exc:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return line_no, None, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile q (0-100) of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = round(q / 100 * (len(sorted_values) - 1))
+    return sorted_values[min(len(sorted_values) - 1, max(rank, 0))]
+
+
+def run_batch(manifest, out_dir, workers=None, max_in_flight=None, progress_every=100, log=sys.stderr,
+              dry_run=False, output_profile=None):
+    """Render every spec in manifest into out_dir and return a summary dict.
+
+    Failed entries are reported (with their manifest line) rather than
+    aborting the run; an entry whose output file name was already used by an
+    earlier entry fails instead of overwriting it. The summary holds counts,
+    throughput and latency percentiles in seconds of the rendered documents;
+    failures are left out of both. With dry_run, page maps are written instead of PDFs. output_profile is
+    the output profile for specs without one.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    latencies = []
+    failures = []
+    claimed = {}  # output path -> manifest line that wrote it
+    start = time.perf_counter()
+
+    def report(line_no, error):
+        failures.append({"line": line_no, "error": error})
+        print(f"[batch] line {line_no} failed: {error}", file=log)
+
+    def collect(finished):
+        for future in finished:
+            line_no, _path, seconds, error = future.result()
+            if error:
+                report(line_no, error)
+            else:
+                latencies.append(seconds)
+            done = len(latencies) + len(failures)
+            if log and progress_every and done % progress_every == 0:
+                rate = done / (time.perf_counter() - start)
+                print(f"[batch] {done} done, {len(failures)} failed, {rate:.1f} docs/s", file=log)
+
+    pending = set()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for line_no, entry in iter_manifest(manifest):
+            try:
+                spec = load_spec(entry)
+            except Exception as exc:
+                report(line_no, f"{type(exc).__name__}: {exc}")
+                continue
+            spec["output_profile"] = spec["output_profile"] or output_profile
+            path = _output_path(line_no, spec, out_dir, dry_run)
+            if path in claimed:
+                report(line_no, f"output {os.path.basename(path)!r} already written by line {claimed[path]}")
+                continue
+            claimed[path] = line_no
+            if len(pending) >= max_in_flight:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+            pending.add(pool.submit(_render_entry, line_no, spec, path, dry_run))
+        collect(wait(pending).done)
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rendered": len(latencies),
+        "failed": len(failures),
+        "failures": failures,
+        "elapsed": elapsed,
+        "docs_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "latency": {f"p{q}": percentile(latencies, q) for q in (50, 90, 99)}
+        | {"max": latencies[-1] if latencies else 0.0},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("manifest", help="JSONL or CSV manifest of content specs")
+    parser.add_argument("--out-dir", default="reports")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="specs queued or rendering at once (default: 4 per worker)")
+    parser.add_argument("--progress-every", type=int, default=100)
+    parser.add_argument("--dry-run", action="store_true", help="write page maps instead of PDFs")
+    parser.add_argument("--output-profile", choices=OUTPUT_PROFILE_NAMES,
+                        help="output profile for specs that do not set one")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(args.manifest, args.out_dir, args.workers, args.max_in_flight, args.progress_every,
+                        dry_run=args.dry_run, output_profile=args.output_profile)
+    print(json.dumps({k: v for k, v in summary.items() if k != "failures"}, indent=2))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Content-addressed on-disk cache of rendered SOJAI press release PDFs.
+
+    cache = RenderCache("/var/cache/sojai-pdf", max_bytes=512 << 20)
+    pdf = cache.render(spec)            # bytes, rendered only on a miss
+    path = cache.get_path(spec)         # cached file path or None
+
+Entries are keyed by a SHA-256 of the normalized spec (minus the output
+file name) and the generator version: the generator and spec module sources,
+which hold the style, theme and template definitions, plus the reportlab
+version. Editing any of them changes every key, so stale PDFs are never
+served. Lookups import neither reportlab nor the generator.
+
+Writes go to a temporary file in the target directory followed by
+os.replace, so concurrent workers sharing a directory never see partial
+files. Hits refresh the file's mtime; when the directory grows past
+max_bytes the least recently used entries are removed.
+"""
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+from functools import lru_cache
+
+from press_release_spec import normalize_spec
+
+_SOURCE_MODULES = ("generate_press_release_pdf", "press_release_spec")
+
+
+@lru_cache(maxsize=1)
+def generator_version():
+    """Digest of the generator sources and reportlab version used in cache keys."""
+    digest = hashlib.sha256()
+    for name in _SOURCE_MODULES:
+        with open(importlib.util.find_spec(name).origin, "rb") as fh:
+            digest.update(fh.read())
+    try:
+        digest.update(importlib.metadata.version("reportlab").encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    return digest.hexdigest()
+
+
+def cache_key(spec):
+    """Stable hex key for a spec; specs differing only in "output" share a key."""
+    content = {k: v for k, v in normalize_spec(spec).items() if k != "output"}
+    payload = json.dumps(content, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{generator_version()}\n{payload}".encode()).hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of PDF bytes in a directory shared between processes.
+
+    Counters are per instance; stats() returns them with the current size.
+    """
+    def __init__(self, directory, max_bytes=512 << 20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._size = sum(size for _path, size, _mtime in self._entries())
+
+    def path_for(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.pdf")
+
+    def _count(self, name, delta=1):
+        with self._lock:
+            self.counters[name] += delta
+
+    def _entries(self):
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".pdf"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def get_path(self, spec, key=None):
+        """Path of the cached PDF for spec, or None on a miss."""
+        path = self.path_for(key or cache_key(spec))
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return path
+
+    def get(self, spec, key=None):
+        """Cached PDF bytes for spec, or None on a miss."""
+        path = self.get_path(spec, key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as fh:
+                return fh.read()
+        except FileNotFoundError:
+            # Evicted by another process between the lookup and the read.
+            with self._lock:
+                self.counters["hits"] -= 1
+                self.counters["misses"] += 1
+            return None
+
+    def put(self, spec, pdf, key=None):
+        """Store pdf for spec atomically and return its path."""
+        path = self.path_for(key or cache_key(spec))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(pdf)
+            try:
+                replaced = os.stat(path).st_size  # another worker stored this key first
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        with self._lock:
+            self.counters["stores"] += 1
+            self._size += len(pdf) - replaced
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+        return path
+
+    def evict(self):
+        """Remove least recently used entries until the cache is under 90% of max_bytes.
+
+        The directory is rescanned, so entries written by other processes
+        are accounted for.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        size = sum(e[1] for e in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for path, entry_size, _mtime in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        with self._lock:
+            self._size = size
+            self.counters["evictions"] += evicted
+        return evicted
+
+    def render(self, spec, render=None):
+        """PDF bytes for spec from the cache, rendering and storing them on a miss.
+
+        render(normalized_spec) -> bytes defaults to the generator's
+        render_pdf_bytes, imported only when a miss needs it.
+        """
+        key = cache_key(spec)
+        pdf = self.get(spec, key)
+        if pdf is None:
+            if render is None:
+                import generate_press_release_pdf as gen
+                pdf = gen.render_pdf_bytes(spec=normalize_spec(spec))
+            else:
+                pdf = render(normalize_spec(spec))
+            self.put(spec, pdf, key)
+        return pdf
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, bytes=self._size, max_bytes=self.max_bytes)
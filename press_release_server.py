@@ -0,0 +1,464 @@
+"""
+Warm local render server for the SOJAI press release generator.
+
+    python press_release_server.py --port 8765 --workers 4 --max-queue 32 --recycle-after 500
+    python press_release_server.py --unix /tmp/sojai-render.sock
+    python press_release_server.py --cache-dir /var/cache/sojai-pdf --cache-max-mb 512
+    python press_release_server.py --output-profile smallest
+    python press_release_server.py --async --port 8765 --max-queue 8
+
+Worker processes import reportlab and warm the style registry once at
+start-up, so a request only pays for its render instead of interpreter
+start-up and imports. POST /render with a JSON content spec (see
+press_release_spec) returns application/pdf; GET /stats returns counters.
+Requests beyond the queue bound are refused with 503 instead of piling up,
+and each worker is replaced after --recycle-after renders to cap memory growth.
+With --cache-dir, repeated specs are answered from the render cache (see
+press_release_cache) without touching the workers. --output-profile sets the
+output profile for requests whose spec does not name one. POST /render?timeout=5
+shortens the render timeout for one request.
+
+With --async the endpoint runs on one asyncio event loop instead of a
+thread per connection, and a full queue is answered with 429 and
+Retry-After. Async web code can skip HTTP altogether and await
+render_async(spec), or RenderService.render_async on its own service.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from press_release_batch import _init_worker, percentile
+from press_release_cache import RenderCache, cache_key
+from press_release_spec import OUTPUT_PROFILE_NAMES, load_spec, normalize_spec
+
+MAX_BODY = 1 << 20
+
+
+def _ping():
+    return os.getpid()
+
+
+def _render(spec):
+    import generate_press_release_pdf as gen
+    return gen.render_pdf_bytes(spec=spec)
+
+
+class QueueFull(Exception):
+    """Raised when a render is refused because the request queue is full."""
+
+
+class RenderService:
+    """Pool of warm render workers behind a bounded request queue.
+
+    At most workers + max_queue renders are admitted at once; submit()
+    raises QueueFull beyond that. Workers are spawned fresh (not forked) so
+    they can be recycled after recycle_after renders. output_profile is the
+    output profile for specs that do not set one.
+    """
+    def __init__(self, workers=None, max_queue=32, recycle_after=500, cache=None, output_profile=None):
+        self.cache = cache
+        self.output_profile = output_profile
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker, max_tasks_per_child=recycle_after or None)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=1000)
+        self.counters = {"rendered": 0, "failed": 0, "rejected": 0, "timed_out": 0, "cancelled": 0,
+                         "in_flight": 0}
+
+    def warm(self):
+        """Start every worker now rather than on the first requests."""
+        for future in [self._pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+
+    def _count(self, key, delta=1):
+        with self._lock:
+            self.counters[key] += delta
+
+    def submit(self, spec):
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise QueueFull(f"{self.workers + self.max_queue} renders already admitted")
+        self._count("in_flight")
+        try:
+            future = self._pool.submit(_render, spec)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _f: self._release())
+        return future
+
+    def _release(self):
+        self._count("in_flight", -1)
+        self._slots.release()
+
+    def _with_output_profile(self, spec):
+        if self.output_profile and spec["output_profile"] is None:
+            return dict(spec, output_profile=self.output_profile)
+        return spec
+
+    def _rendered(self, start):
+        with self._lock:
+            self.counters["rendered"] += 1
+            self._latencies.append(time.perf_counter() - start)
+
+    def render(self, spec, timeout=None):
+        """Render a normalized spec and return the PDF bytes."""
+        start = time.perf_counter()
+        spec = self._with_output_profile(spec)
+        key = None
+        if self.cache is not None:
+            key = cache_key(spec)
+            pdf = self.cache.get(spec, key)
+            if pdf is not None:
+                return pdf
+        future = self.submit(spec)
+        try:
+            pdf = future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            self._count("timed_out")
+            raise
+        except Exception:
+            self._count("failed")
+            raise
+        self._rendered(start)
+        if self.cache is not None:
+            self.cache.put(spec, pdf, key)
+        return pdf
+
+    async def render_async(self, spec, timeout=None):
+        """render() for asyncio callers; the event loop is never blocked.
+
+        QueueFull is raised at once when the queue is full. When timeout
+        expires or the awaiting task is cancelled, a job still waiting in
+        the queue is cancelled and never rendered; one already in a worker
+        runs to completion and its result is dropped.
+        """
+        start = time.perf_counter()
+        spec = self._with_output_profile(spec)
+        key = None
+        if self.cache is not None:
+            key = cache_key(spec)
+            pdf = await asyncio.to_thread(self.cache.get, spec, key)
+            if pdf is not None:
+                return pdf
+        future = self.submit(spec)
+        try:
+            pdf = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            self._count("timed_out")
+            raise
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._count("failed")
+            raise
+        finally:
+            if future.cancelled():
+                self._count("cancelled")
+        self._rendered(start)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put, spec, pdf, key)
+        return pdf
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = dict(self.counters, workers=self.workers, max_queue=self.max_queue)
+        stats["queue_depth"] = max(stats["in_flight"] - self.workers, 0)  # admitted, not yet rendering
+        for q in (50, 99):
+            stats[f"p{q}_ms"] = percentile(latencies, q) * 1e3
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def default_service():
+    """Process-wide RenderService behind render_async(), started on first use."""
+    return RenderService()
+
+
+async def render_async(spec=None, timeout=None):
+    """Render spec (see press_release_spec) in a warm worker process and return the PDF bytes.
+
+    Raises QueueFull when the default service's queue is full and
+    TimeoutError after timeout seconds.
+    """
+    return await default_service().render_async(normalize_spec(spec), timeout)
+
+
+def _request_timeout(query, default):
+    """Render timeout for a request: its ?timeout= value, capped at the server default."""
+    values = parse_qs(query).get("timeout")
+    if not values:
+        return default
+    timeout = float(values[-1])
+    if not timeout > 0:
+        raise ValueError("timeout must be a positive number of seconds")
+    return min(timeout, default) if default else timeout
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        return self.client_address[0] if self.client_address else "unix"
+
+    def _send(self, status, body, content_type="application/json", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, obj, headers=()):
+        self._send(status, json.dumps(obj).encode(), headers=headers)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send_json(200, self.server.service.stats())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            return self._send_json(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            return self._send_json(400, {"error": "bad Content-Length"})
+        if length > MAX_BODY:
+            self.close_connection = True  # the unread body must not be parsed as the next request
+            return self._send_json(413, {"error": f"spec larger than {MAX_BODY} bytes"})
+        try:
+            spec = load_spec(self.rfile.read(length).decode("utf-8") if length else "{}")
+            timeout = _request_timeout(url.query, self.server.timeout_s)
+        except ValueError as exc:
+            return self._send_json(400, {"error": str(exc)})
+        try:
+            pdf = self.server.service.render(spec, timeout=timeout)
+        except QueueFull as exc:
+            return self._send_json(503, {"error": str(exc)}, headers=[("Retry-After", "1")])
+        except TimeoutError:
+            return self._send_json(504, {"error": f"render exceeded {timeout}s"})
+        except Exception as exc:
+            return self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+        self._send(200, pdf, "application/pdf")
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, fmt, *args)
+
+
+class UnixRenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service, host="127.0.0.1", port=8765, unix_socket=None, timeout_s=60.0, verbose=False):
+    """HTTP server bound to localhost (or a Unix socket) that renders through service."""
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.remove(unix_socket)
+        server = UnixRenderServer(unix_socket, RenderHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.service = service
+    server.timeout_s = timeout_s
+    server.verbose = verbose
+    return server
+
+
+class AsyncRenderServer:
+    """Asyncio HTTP/1.1 front end for a RenderService, with RenderHandler's routes.
+
+    Every connection is served by one event loop, so a burst of requests
+    costs coroutines rather than threads. A full queue is answered with 429
+    and Retry-After; a client that disconnects while its request is pending
+    cancels the render if it has not started (a client that half-closes its
+    socket after sending counts as disconnected).
+    """
+    def __init__(self, service, timeout_s=60.0, verbose=False):
+        self.service = service
+        self.timeout_s = timeout_s
+        self.verbose = verbose
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=8765, unix_socket=None):
+        if unix_socket:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            self.server = await asyncio.start_unix_server(self._serve, path=unix_socket)
+        else:
+            self.server = await asyncio.start_server(self._serve, host, port)
+        return self.server
+
+    async def _serve(self, reader, writer):
+        next_line = asyncio.ensure_future(reader.readline())
+        try:
+            while True:
+                try:
+                    request_line = await next_line
+                except ValueError:  # longer than the StreamReader limit
+                    await self._respond(writer, 414, {"error": "request line too long"}, keep_alive=False)
+                    break
+                if not request_line.strip():
+                    break
+                headers = {}
+                try:
+                    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    await self._respond(writer, 431, {"error": "header line too long"}, keep_alive=False)
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                    length = int(headers.get("content-length") or 0)
+                    if length < 0:
+                        raise ValueError("negative Content-Length")
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "malformed request"}, keep_alive=False)
+                    break
+                if "transfer-encoding" in headers:
+                    await self._respond(writer, 411, {"error": "send the spec with a Content-Length"},
+                                        keep_alive=False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": f"spec larger than {MAX_BODY} bytes"},
+                                        keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                # Reading the next request line doubles as a disconnect watch while this one renders.
+                next_line = asyncio.ensure_future(reader.readline())
+                dispatch = asyncio.ensure_future(self._dispatch(method, target, body))
+                await asyncio.wait((dispatch, next_line), return_when=asyncio.FIRST_COMPLETED)
+                if not dispatch.done():
+                    error = next_line.exception()
+                    if isinstance(error, ConnectionError) or (error is None and not next_line.result()):
+                        dispatch.cancel()  # the client hung up
+                        break
+                status, payload, extra = await dispatch
+                if self.verbose:
+                    print(f"{method} {target} {status}")
+                await self._respond(writer, status, payload, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            next_line.cancel()
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        if method == "GET" and url.path == "/stats":
+            return 200, self.service.stats(), ()
+        if method != "POST" or url.path != "/render":
+            return 404, {"error": "not found"}, ()
+        try:
+            spec = load_spec(body.decode("utf-8") if body else "{}")
+            timeout = _request_timeout(url.query, self.timeout_s)
+        except ValueError as exc:
+            return 400, {"error": str(exc)}, ()
+        try:
+            return 200, await self.service.render_async(spec, timeout), ()
+        except QueueFull as exc:
+            return 429, {"error": str(exc)}, [("Retry-After", "1")]
+        except TimeoutError:
+            return 504, {"error": f"render exceeded {timeout}s"}, ()
+        except Exception as exc:
+            return 500, {"error": f"{type(exc).__name__}: {exc}"}, ()
+
+    @staticmethod
+    async def _respond(writer, status, payload, headers=(), keep_alive=True):
+        if isinstance(payload, bytes):
+            body, content_type = payload, "application/pdf"
+        else:
+            body, content_type = json.dumps(payload).encode(), "application/json"
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", f"Content-Type: {content_type}",
+                 f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f"{name}: {value}" for name, value in headers]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve_async(service, host="127.0.0.1", port=8765, unix_socket=None, timeout_s=60.0, verbose=False):
+    """Run an AsyncRenderServer for service until cancelled."""
+    front = AsyncRenderServer(service, timeout_s, verbose)
+    server = await front.start(host, port, unix_socket)
+    where = unix_socket or f"http://{host}:{server.sockets[0].getsockname()[1]}"
+    print(f"Async render server ready on {where} ({service.workers} workers)")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--max-queue", type=int, default=32, help="renders waiting beyond the busy workers")
+    parser.add_argument("--recycle-after", type=int, default=500, help="renders per worker before it is replaced")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-request render timeout in seconds")
+    parser.add_argument("--cache-dir", help="serve repeated specs from a render cache in this directory")
+    parser.add_argument("--cache-max-mb", type=float, default=512, help="render cache size bound")
+    parser.add_argument("--output-profile", choices=OUTPUT_PROFILE_NAMES,
+                        help="output profile for requests that do not set one")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="serve from an asyncio event loop; a full queue returns 429")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    cache = RenderCache(args.cache_dir, int(args.cache_max_mb * (1 << 20))) if args.cache_dir else None
+    service = RenderService(args.workers, args.max_queue, args.recycle_after, cache, args.output_profile)
+    service.warm()
+    if args.use_async:
+        try:
+            asyncio.run(serve_async(service, args.host, args.port, args.unix, args.timeout, args.verbose))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.close()
+        return
+    server = make_server(service, args.host, args.port, args.unix, args.timeout, args.verbose)
+    where = args.unix or f"http://{args.host}:{server.server_address[1]}"
+    print(f"Render server ready on {where} ({service.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
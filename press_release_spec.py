@@ -0,0 +1,163 @@
+"""
+Content specs for the SOJAI press release generator.
+
+A spec is a plain JSON-compatible dict holding the per-document content:
+stats, pathology accuracies, quotes, branding colours and contact line.
+Keys a spec leaves out fall back to DEFAULT_SPEC. Text fields are reportlab
+paragraph markup (escape & and < as &amp; and &lt;).
+
+This module does not import reportlab, so manifests can be streamed and
+validated without paying for the layout machinery.
+"""
+
+import csv
+import json
+import re
+
+DEFAULT_SPEC = {
+    "title": "SOJAI - Press Release 2026",
+    "author": "SOJAI",
+    "tag": "PRESS RELEASE  |  2026",
+    "footer": "SOJAI  |  Press Release 2026",
+    "contact": "www.sojai.com  |  contact@sojai.com",
+    "stats": [
+        ["99.8%", "Accuracy"], ["130+", "Pathologies"],
+        ["&lt;60s", "Analysis Time"], ["10,000+", "Practitioners"],
+    ],
+    "pathologies": [
+        ["Impacted Teeth", 99.5], ["Caries Detection", 99.2],
+        ["Periapical Lesions", 98.7], ["Bone Loss Analysis", 97.9],
+        ["Root Fractures", 96.5], ["Sinus Pathology", 95.8],
+    ],
+    "quotes": [
+        {
+            "text": "\u201cThe pathology detection has changed my daily practice. Last week, SOJAI flagged a root "
+                    "fracture on a lower first molar that I would have probably diagnosed as irreversible pulpitis. "
+                    "And the PDF reports \u2014 my patients finally understand what I\u2019m showing them. Treatment plan "
+                    "acceptance rates have gone up significantly since we started using the platform.\u201d",
+            "name": "Dr. Sarah Chen",
+            "role": "Oral Surgeon \u2014 Boston, MA",
+        },
+        {
+            "text": "\u201cIntegration with our Planmeca CBCT took literally five minutes. But what really sold me "
+                    "is the 3D segmentation: being able to isolate a tooth, trace the root canal in 3D, and "
+                    "export to STL for planning an endo retreatment \u2014 that\u2019s a massive time saver. We\u2019ve cut "
+                    "our pre-operative planning time in half.\u201d",
+            "name": "Dr. Emma Larsson",
+            "role": "Endodontist \u2014 Stockholm, Sweden",
+        },
+    ],
+    # Palette overrides: Theme slot name -> "#RRGGBB" (plus an optional "name").
+    "theme": {},
+    # File name used by batch mode; None lets the batch runner number outputs.
+    "output": None,
+    # Output profile (one of OUTPUT_PROFILE_NAMES); None keeps reportlab's stream defaults.
+    "output_profile": None,
+}
+
+# Palette slots a spec's "theme" may override; the generator's Theme fields.
+THEME_SLOTS = (
+    "primary", "pink", "light_bg", "badge_bg", "text_dark", "text_muted", "cyan", "white", "dark_bg",
+    "cover_subtitle", "text_on_dark", "label_on_dark", "footer_on_dark", "detail_on_dark", "rule",
+    "glow", "glow_secondary",
+)
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}(?:[0-9A-Fa-f]{2})?")
+
+# Size/speed trade-offs for the written PDF, defined by the generator's OUTPUT_PROFILES.
+OUTPUT_PROFILE_NAMES = ("fast", "smallest")
+
+_TEXT_KEYS = ("title", "author", "tag", "footer", "contact")
+_JSON_COLUMNS = ("stats", "pathologies", "quotes", "theme")
+
+
+def normalize_spec(spec=None):
+    """Return a validated copy of spec with DEFAULT_SPEC filled in.
+
+    Raises ValueError when a field has the wrong shape.
+    """
+    spec = spec or {}
+    unknown = set(spec) - set(DEFAULT_SPEC)
+    if unknown:
+        raise ValueError(f"unknown spec keys: {', '.join(sorted(unknown))}")
+    out = {**DEFAULT_SPEC, **spec}
+
+    for key in _TEXT_KEYS:
+        if not isinstance(out[key], str):
+            raise ValueError(f"spec {key!r} must be a string")
+    try:
+        out["stats"] = [[str(number), str(label)] for number, label in out["stats"]]
+        out["pathologies"] = [[str(label), float(value)] for label, value in out["pathologies"]]
+        out["quotes"] = [{"text": str(q["text"]), "name": str(q["name"]), "role": str(q["role"])}
+                         for q in out["quotes"]]
+    except (TypeError, ValueError, KeyError) as exc:
+        raise ValueError(f"malformed spec content: {exc!r}") from None
+    if not out["stats"]:
+        raise ValueError("spec 'stats' must not be empty")
+    for label, value in out["pathologies"]:
+        if not 0 <= value <= 100:
+            raise ValueError(f"pathology {label!r} accuracy {value} is outside 0-100")
+    if not isinstance(out["theme"], dict):
+        raise ValueError("spec 'theme' must be an object")
+    out["theme"] = {str(k): str(v) for k, v in out["theme"].items()}
+    for slot, value in out["theme"].items():
+        if slot == "name":
+            continue
+        if slot not in THEME_SLOTS:
+            raise ValueError(f"unknown theme slot {slot!r}")
+        if not _HEX_COLOR.fullmatch(value):
+            raise ValueError(f"theme {slot!r} must be \"#RRGGBB\" or \"#RRGGBBAA\", not {value!r}")
+    if out["output"] is not None:
+        out["output"] = str(out["output"])
+    if out["output_profile"] is not None and out["output_profile"] not in OUTPUT_PROFILE_NAMES:
+        raise ValueError(f"spec 'output_profile' must be one of {', '.join(OUTPUT_PROFILE_NAMES)}")
+    return out
+
+
+class CsvRow(dict):
+    """Raw CSV manifest row: string values, JSON columns not yet decoded."""
+
+
+def _spec_from_csv_row(row):
+    spec = {}
+    for key, value in row.items():
+        if value is None or value == "":
+            continue
+        if key.startswith("theme."):
+            spec.setdefault("theme", {})[key[len("theme."):]] = value
+        elif key in _JSON_COLUMNS:
+            spec[key] = json.loads(value)
+        else:
+            spec[key] = value
+    return spec
+
+
+def load_spec(entry):
+    """Normalize a manifest entry: a JSON line, a CSV row dict or a spec dict."""
+    if isinstance(entry, str):
+        entry = json.loads(entry)
+        if not isinstance(entry, dict):
+            raise ValueError("manifest line is not a JSON object")
+    elif isinstance(entry, CsvRow):
+        entry = _spec_from_csv_row(entry)
+    return normalize_spec(entry)
+
+
+def iter_manifest(path):
+    """Stream (line_number, entry) pairs from a JSONL or CSV manifest.
+
+    Entries are raw JSON lines or CsvRow dicts; pass them to load_spec(),
+    which is where malformed input is reported, so one bad row does not stop
+    the stream. CSV columns are spec keys: stats, pathologies, quotes and
+    theme hold JSON, and theme.<slot> columns set single palette entries.
+    A CSV row is numbered by the line it ends on, since quoted cells may
+    span several lines.
+    """
+    with open(path, newline="", encoding="utf-8") as fh:
+        if path.lower().endswith(".csv"):
+            reader = csv.DictReader(fh)
+            for row in reader:
+                yield reader.line_num, CsvRow(row)
+        else:
+            for line_no, line in enumerate(fh, start=1):
+                if line.strip():
+                    yield line_no, line
@@ -0,0 +1,329 @@
+"""
+Regression tests for the hand-written PDF serialization paths: the streaming
+build (StreamingCanvas / FlowableStream) and the section splicer behind
+build_pdf_parallel().
+
+    python -m pytest -q test_press_release_pdf.py
+
+PDFs are read with a small object parser instead of a PDF library, so the
+tests only need reportlab. Spec validation, the render cache, the text
+metrics cache, dry_run() pagination and the render server are covered too.
+"""
+
+import asyncio
+import base64
+import io
+import re
+import socket
+import threading
+import time
+import zlib
+
+import pytest
+from reportlab import rl_config
+
+import generate_press_release_pdf as gen
+import press_release_server as srv
+from press_release_cache import RenderCache
+from press_release_spec import normalize_spec
+
+_OBJECT = re.compile(rb"(\d+) 0 obj\r?\n(.*?)\r?\nendobj", re.S)
+_REF = re.compile(rb"(\d+) 0 R")
+_STREAM = re.compile(rb"stream\r?\n(.*?)endstream", re.S)
+
+
+@pytest.fixture(autouse=True)
+def invariant(monkeypatch):
+    """Fixed dates and document ids, so two builds can be compared byte for byte."""
+    monkeypatch.setattr(rl_config, "invariant", 1)
+
+
+def objects(pdf):
+    return {int(num): body for num, body in _OBJECT.findall(pdf)}
+
+
+def stream_data(body):
+    """Decoded content of a stream object body (ASCII85 and/or Flate)."""
+    data = _STREAM.search(body).group(1)
+    if b"/ASCII85Decode" in body:
+        data = base64.a85decode(data.strip(), adobe=True)
+    if b"/FlateDecode" in body:
+        data = zlib.decompress(data)
+    return data
+
+
+def canonical(objs, num, stack=()):
+    """Object num with every reference replaced by the object it points to.
+
+    Object numbering is the only thing allowed to differ between equivalent
+    files; back references (/Parent, /Prev...) become a cycle marker.
+    """
+    if num in stack:
+        return b"<cycle>"
+    return _REF.sub(lambda m: b"{" + canonical(objs, int(m.group(1)), stack + (num,)) + b"}", objs[num])
+
+
+def page_streams(pdf):
+    """Decoded content stream of every page, in page order."""
+    objs = objects(pdf)
+    root = int(re.search(rb"/Root (\d+) 0 R", pdf).group(1))
+    pages = int(re.search(rb"/Pages (\d+) 0 R", objs[root]).group(1))
+    kids = re.search(rb"/Kids \[(.*?)\]", objs[pages], re.S).group(1)
+    out = []
+    for kid in _REF.findall(kids):
+        contents = int(re.search(rb"/Contents (\d+) 0 R", objs[int(kid)]).group(1))
+        out.append(stream_data(objs[contents]))
+    return out
+
+
+def footers(pdf):
+    return [re.findall(rb"\(([^()]*Page \d+[^()]*)\) Tj", page) for page in page_streams(pdf)]
+
+
+def backgrounds(pdf):
+    return [re.findall(rb"/FormXob\.(PRBackground_\w+) Do", page) for page in page_streams(pdf)]
+
+
+def page_total(pdf):
+    (body,) = [body for body in objects(pdf).values() if b"/Subtype /Form" in body and
+               re.fullmatch(rb"BT /F\d+ 8 Tf 1 0 0 1 [\d.]+ [\d.]+ Tm \(\d+\) Tj ET", stream_data(body).strip())]
+    return int(re.search(rb"\((\d+)\) Tj", stream_data(body)).group(1))
+
+
+def check_xref(pdf):
+    start = int(re.search(rb"startxref\r?\n(\d+)", pdf).group(1))
+    assert pdf[start:start + 4] == b"xref"
+    lines = pdf[start:].splitlines()
+    first, count = map(int, lines[1].split())
+    assert first == 0
+    entries = lines[2:2 + count]
+    for num, entry in enumerate(entries):
+        offset, _gen, kind = entry.split()
+        if kind == b"n":
+            assert pdf[int(offset):].startswith(b"%d 0 obj" % num), f"object {num} not at offset {int(offset)}"
+    assert int(re.search(rb"/Size (\d+)", pdf[start:]).group(1)) == count
+    assert sorted(objects(pdf)) == list(range(1, count))
+
+
+def render(**kw):
+    return gen.build_pdf(io.BytesIO(), verbose=False, **kw).getvalue()
+
+
+LONG_SECTIONS = (gen.build_cover, *[gen.build_announcement] * 6, gen.build_quotes)
+
+
+@pytest.mark.parametrize("sections", [None, LONG_SECTIONS], ids=["press_release", "long"])
+@pytest.mark.parametrize("page_total_footer", [True, False], ids=["page_total", "page_only"])
+def test_streamed_build_matches_list_build(sections, page_total_footer):
+    listed = render(sections=sections, page_total=page_total_footer)
+    streamed = render(sections=sections, page_total=page_total_footer, stream=True)
+    check_xref(listed)
+    check_xref(streamed)
+    assert page_streams(streamed) == page_streams(listed)
+    list_objs, stream_objs = objects(listed), objects(streamed)
+    assert sorted(canonical(stream_objs, n) for n in stream_objs) == \
+        sorted(canonical(list_objs, n) for n in list_objs)
+
+
+def test_streamed_build_to_file(tmp_path):
+    path = tmp_path / "streamed.pdf"
+    gen.build_pdf(str(path), verbose=False, sections=LONG_SECTIONS, stream=True)
+    pdf = path.read_bytes()
+    check_xref(pdf)
+    assert page_streams(pdf) == page_streams(render(sections=LONG_SECTIONS))
+
+
+@pytest.mark.parametrize("sections", [None, LONG_SECTIONS], ids=["press_release", "long"])
+def test_parallel_build_matches_serial_build(sections):
+    serial = render(sections=sections)
+    parallel = gen.build_pdf_parallel(io.BytesIO(), verbose=False, sections=sections, workers=2).getvalue()
+    check_xref(parallel)
+    assert len(page_streams(parallel)) == len(page_streams(serial))
+    assert footers(parallel) == footers(serial)
+    assert backgrounds(parallel) == backgrounds(serial)
+    assert page_total(parallel) == page_total(serial) == len(page_streams(serial))
+
+
+@pytest.mark.parametrize("mode", ["I;16", "I", "F"])
+def test_high_bit_depth_gray_is_windowed_to_8_bits(mode):
+    Image = pytest.importorskip("PIL.Image")
+    ramp = Image.new("I", (400, 40))
+    ramp.putdata([x * 3990 // 399 for _y in range(40) for x in range(400)])  # 12-bit values
+    buf = io.BytesIO()
+    ramp.convert(mode).save(buf, "TIFF")
+    image = gen._prepare_image(buf.getvalue(), (400, 40))
+    pixels = zlib.decompress(image.data)
+    assert image.color_space == "DeviceGray"
+    assert (min(pixels), max(pixels)) == (0, 255)
+    assert len(set(pixels)) > 200
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"stats": []}, "'stats' must not be empty"),
+    ({"colour": "red"}, "unknown spec keys: colour"),
+    ({"title": 3}, "'title' must be a string"),
+    ({"pathologies": [["Caries", 101]]}, "outside 0-100"),
+    ({"quotes": [{"text": "t", "name": "n"}]}, "malformed spec content"),
+    ({"theme": {"primry": "#4A39C0"}}, "unknown theme slot 'primry'"),
+    ({"theme": {"white": "white"}}, "theme 'white' must be"),
+    ({"theme": {"white": "#FFF"}}, "theme 'white' must be"),
+    ({"output_profile": "tiny"}, "'output_profile' must be one of"),
+], ids=["empty_stats", "unknown_key", "text_type", "accuracy_range", "quote_fields",
+        "theme_slot", "theme_name", "theme_short_hex", "output_profile"])
+def test_normalize_spec_rejects(spec, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        normalize_spec(spec)
+
+
+def test_normalize_spec_accepts_theme_overrides():
+    spec = normalize_spec({"theme": {"name": "night", "white": "#F0E0D0", "rule": "#00000080"}})
+    assert spec["theme"] == {"name": "night", "white": "#F0E0D0", "rule": "#00000080"}
+    assert spec["stats"] == normalize_spec()["stats"]
+
+
+def test_render_cache_counters_and_eviction(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=1000)
+    specs = [{"title": f"doc {i}"} for i in range(4)]
+    assert cache.get(specs[0]) is None
+    cache.put(specs[0], b"a" * 300)
+    assert cache.get(specs[0]) == b"a" * 300
+    for _ in range(5):  # re-storing a key replaces it, so nothing is evicted
+        cache.put(specs[0], b"a" * 300)
+    assert cache.stats()["bytes"] == 300
+    assert cache.counters == {"hits": 1, "misses": 1, "stores": 6, "evictions": 0}
+
+    for i, spec in enumerate(specs[1:], 1):
+        time.sleep(0.01)  # distinct mtimes for the LRU order
+        cache.put(spec, bytes([i]) * 300)
+    assert cache.counters["evictions"] == 1
+    assert cache.get(specs[0]) is None  # least recently used
+    assert [cache.get(spec) is not None for spec in specs[1:]] == [True] * 3
+    assert cache.stats()["bytes"] == 900
+
+
+def test_text_metrics_cache_output_is_byte_identical():
+    plain = render(sections=LONG_SECTIONS)
+    gen.enable_text_metrics_cache()
+    try:
+        cold = render(sections=LONG_SECTIONS)
+        warm = render(sections=LONG_SECTIONS)
+        stats = gen.text_metrics_stats()
+    finally:
+        gen.disable_text_metrics_cache()
+    assert cold == warm == plain
+    assert stats["widths"]["hits"] > 0 and stats["layouts"]["hits"] > 0
+    assert gen.text_metrics_stats() == {}
+
+
+@pytest.mark.parametrize("sections", [None, LONG_SECTIONS], ids=["press_release", "long"])
+@pytest.mark.parametrize("spec", [None, {"pathologies": [[f"Finding {i}", 90 + i % 10] for i in range(60)]}],
+                         ids=["default_spec", "long_chart"])
+def test_dry_run_page_count_matches_render(sections, spec):
+    page_map = gen.dry_run(spec, sections=sections)
+    pdf = render(spec=spec, sections=sections)
+    assert len(page_map["pages"]) == len(page_streams(pdf)) == page_total(pdf)
+    assert page_map["sections"][-1]["last_page"] == len(page_map["pages"])
+
+
+def test_accuracy_chart_split():
+    rows = [(f"Finding {i}", f"{90 + i % 10}.5") for i in range(12)]  # string values, as from a NumPy array
+    chart = gen.AccuracyChart(rows, header=("FINDING", "ACCURACY"))
+    assert chart.values[:2] == [90.5, 91.5]
+    width, height = chart.wrap(440, 1000)
+    assert height == chart.header_height + 12 * chart.row_height + 11 * chart.row_gap
+
+    first, rest = chart.split(440, chart._height(5) + 1)
+    assert (first.labels, rest.labels) == (chart.labels[:5], chart.labels[5:])
+    assert first.values + rest.values == chart.values
+    assert first.header == rest.header == ("FINDING", "ACCURACY")
+    assert first.wrap(440, 1000)[1] <= chart._height(5) + 1
+
+    # A part never holds fewer than min_rows: the tail is left two rows at least.
+    first, rest = chart.split(440, chart._height(11))
+    assert (len(first.labels), len(rest.labels)) == (10, 2)
+    assert chart.split(440, chart._height(1)) == []
+    with pytest.raises(ValueError):
+        gen.AccuracyChart(["a", "b"], [1.0])
+
+
+_PAGE_FILL = re.compile(rb"([\d.]+ [\d.]+ [\d.]+) rg\s+n?\s*0 0 595\.2756 841\.8898 re f")
+
+
+@pytest.mark.parametrize("output_profile", ["fast", "smallest"])
+def test_lean_drawing_keeps_a_themed_page_fill(output_profile):
+    pdf = render(spec={"theme": {"white": "#F0E0D0"}}, output_profile=output_profile)
+    fills = _PAGE_FILL.findall(b"\n".join(stream_data(body) for body in objects(pdf).values()
+                                          if _STREAM.search(body)))
+    assert b".941176 .878431 .815686" in fills
+
+
+def test_render_many_without_output_path_returns_bytes():
+    (pdf,) = gen.render_many([{"spec": {"title": "in memory"}}], processes=False)
+    assert isinstance(pdf, bytes)
+    check_xref(pdf)
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = srv.RenderService(1, max_queue=8)
+    service.warm()
+    yield service
+    service.close()
+
+
+def _status(port, content_length):
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        sock.sendall(f"POST /render HTTP/1.1\r\nHost: x\r\nContent-Length: {content_length}\r\n\r\n".encode())
+        return sock.recv(200).split(b"\r\n")[0]
+
+
+@pytest.mark.parametrize("content_length", ["-5", "abc"])
+def test_threaded_server_rejects_bad_content_length(service, content_length):
+    httpd = srv.make_server(service, port=0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        assert _status(httpd.server_address[1], content_length) == b"HTTP/1.1 400 Bad Request"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.mark.parametrize("content_length", ["-5", "abc"])
+def test_async_server_rejects_bad_content_length(service, content_length):
+    async def main():
+        server = await srv.AsyncRenderServer(service).start("127.0.0.1", 0)
+        try:
+            return await asyncio.to_thread(_status, server.sockets[0].getsockname()[1], content_length)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    assert asyncio.run(main()) == b"HTTP/1.1 400 Bad Request"
+
+
+def test_async_server_drops_renders_of_disconnected_clients(service):
+    async def hang_up(port, i):
+        _reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = b'{"title": "t%d"}' % i
+        writer.write(b"POST /render HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+        await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await srv.AsyncRenderServer(service).start("127.0.0.1", 0)
+        try:
+            for i in range(5):
+                await hang_up(server.sockets[0].getsockname()[1], i)
+            await asyncio.sleep(0.5)
+            deadline = time.monotonic() + 60
+            while service.stats()["in_flight"] and time.monotonic() < deadline:
+                await asyncio.sleep(0.1)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    before = service.stats()["rendered"]
+    asyncio.run(main())
+    stats = service.stats()
+    assert stats["in_flight"] == 0
+    assert stats["rendered"] == before